@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+zip 아카이브(.pbk 백업, 북 내보내기 zip) 무결성 확인
+쓰는 쪽은 멤버를 기록하면서 SHA-256을 함께 계산해 마지막에 integrity.json으로 남기고,
+검증은 여러 스레드가 멤버(와 증분 백업이 가리키는 블롭 파일)를 나눠 해시한 뒤
+목록과 비교합니다. 하나라도 틀리면 나머지 작업을 바로 멈춥니다.
+
+integrity.json이 없는 이전 파일은 zip CRC만 확인합니다 (모든 멤버를 끝까지 읽음).
+"""
+
+import os
+import json
+import hashlib
+import datetime
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+from image_store import CHUNK_SIZE
+
+INTEGRITY_NAME = "integrity.json"
+INTEGRITY_VERSION = 1
+VERIFY_WORKERS = max(2, min(8, (os.cpu_count() or 2)))
+
+
+class _VerifyStopped(Exception):
+    """다른 작업이 실패했거나 취소되어 중단"""
+
+
+class HashingWriter:
+    """쓰는 내용의 SHA-256을 함께 계산하는 파일 객체 래퍼"""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self._digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._stream.write(data)
+
+    def hexdigest(self) -> str:
+        return self._digest.hexdigest()
+
+
+class IntegrityManifest:
+    """멤버 이름 -> SHA-256 목록 (아카이브 마지막에 integrity.json으로 기록)"""
+
+    def __init__(self):
+        self.members: Dict[str, str] = {}
+
+    def add_digest(self, name: str, digest: str) -> None:
+        self.members[name] = digest
+
+    def writestr(self, zipf: zipfile.ZipFile, name: str, data: str,
+                 compress_type: Optional[int] = None, compresslevel: Optional[int] = None) -> None:
+        """JSON 등 문자열 멤버를 기록하면서 해시 등록"""
+        encoded = data.encode('utf-8')
+        zipf.writestr(name, encoded, compress_type=compress_type, compresslevel=compresslevel)
+        self.members[name] = hashlib.sha256(encoded).hexdigest()
+
+    def write(self, zipf: zipfile.ZipFile) -> None:
+        payload = {"version": INTEGRITY_VERSION, "algorithm": "sha256", "members": self.members}
+        zipf.writestr(INTEGRITY_NAME, json.dumps(payload, ensure_ascii=False, indent=2))
+
+
+def read_integrity(zipf: zipfile.ZipFile) -> Optional[Dict[str, str]]:
+    """integrity.json의 멤버 해시 목록 (없으면 None)"""
+    if INTEGRITY_NAME not in zipf.namelist():
+        return None
+    return json.loads(zipf.read(INTEGRITY_NAME).decode('utf-8')).get("members", {})
+
+
+def _hash_stream(stream: BinaryIO, stop: threading.Event) -> str:
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+        if stop.is_set():
+            raise _VerifyStopped()
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def failed_result(archive_path: str, reason: str) -> Dict[str, Any]:
+    """검증을 끝까지 하지 못했을 때의 결과 (verify_archive와 같은 형식)"""
+    return {"ok": False, "checked": 0, "total": 0, "failed": os.path.basename(archive_path), "reason": reason,
+            "has_manifest": False, "cancelled": False}
+
+
+def verify_archive(archive_path: str, external: Optional[Dict[str, Tuple[str, str]]] = None,
+                   workers: int = VERIFY_WORKERS,
+                   progress_callback: Optional[Callable[[int, int], None]] = None,
+                   is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """아카이브 무결성 검증 → {"ok", "checked", "total", "failed", "reason", "has_manifest", "cancelled"}
+
+    external은 아카이브 밖에서 함께 확인할 파일 (이름 -> (경로, 기대 해시)), 예: 증분 백업의 블롭.
+    첫 실패에서 남은 작업을 멈추므로 failed에는 처음 발견한 항목 하나만 들어갑니다.
+    """
+    result: Dict[str, Any] = {"ok": False, "checked": 0, "total": 0, "failed": None, "reason": None,
+                              "has_manifest": False, "cancelled": False}
+    try:
+        with zipfile.ZipFile(archive_path, 'r') as zipf:
+            members = [info.filename for info in zipf.infolist() if not info.is_dir()]
+            expected = read_integrity(zipf)
+    except Exception as e:
+        return failed_result(archive_path, f"아카이브를 열 수 없음: {e}")
+
+    result["has_manifest"] = expected is not None
+    if expected is not None:
+        present = set(members)
+        missing = [name for name in expected if name not in present]
+        unlisted = [name for name in members if name != INTEGRITY_NAME and name not in expected]
+        if missing or unlisted:
+            result["failed"] = (missing or unlisted)[0]
+            result["reason"] = "멤버 없음" if missing else "목록에 없는 멤버"
+            return result
+        tasks: List[Tuple[str, Optional[str], Optional[str]]] = [
+            (name, None, digest) for name, digest in expected.items()]
+    else:
+        tasks = [(name, None, None) for name in members]
+    for label, (path, digest) in (external or {}).items():
+        tasks.append((label, path, digest))
+    result["total"] = len(tasks)
+
+    stop = threading.Event()
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    handles_lock = threading.Lock()
+
+    def check(task: Tuple[str, Optional[str], Optional[str]]) -> Optional[str]:
+        """작업 하나 확인, 실패 사유 반환 (성공이면 None)"""
+        name, path, digest = task
+        try:
+            if path is not None:
+                with open(path, 'rb') as f:
+                    actual = _hash_stream(f, stop)
+            else:
+                # ZipFile은 스레드 간 공유하지 않고 스레드마다 따로 엶
+                zipf = getattr(local, "zipf", None)
+                if zipf is None:
+                    zipf = local.zipf = zipfile.ZipFile(archive_path, 'r')
+                    with handles_lock:
+                        handles.append(zipf)
+                with zipf.open(name, 'r') as f:
+                    # 끝까지 읽으면 zipfile이 CRC도 확인
+                    actual = _hash_stream(f, stop)
+        except _VerifyStopped:
+            raise
+        except FileNotFoundError:
+            return "파일 없음"
+        except Exception as e:
+            # 손상된 압축 데이터는 zlib.error / EOFError / LZMAError 등 OSError가 아닌 예외로 나옴
+            return f"읽기 실패: {e}"
+        if digest is not None and actual != digest:
+            return "해시 불일치"
+        return None
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {executor.submit(check, task): task[0] for task in tasks}
+            remaining = set(futures)
+            while remaining:
+                done, remaining = wait(remaining, timeout=0.2, return_when=FIRST_COMPLETED)
+                if is_cancelled and is_cancelled():
+                    result["cancelled"] = True
+                for future in done:
+                    try:
+                        reason = future.result()
+                    except _VerifyStopped:
+                        continue
+                    if reason is not None and result["failed"] is None:
+                        result["failed"] = futures[future]
+                        result["reason"] = reason
+                    elif reason is None:
+                        result["checked"] += 1
+                if result["failed"] is not None or result["cancelled"]:
+                    # 첫 실패/취소에서 나머지 작업 중단
+                    stop.set()
+                    for future in remaining:
+                        future.cancel()
+                    break
+                if progress_callback:
+                    progress_callback(result["checked"], result["total"])
+    finally:
+        for zipf in handles:
+            zipf.close()
+
+    result["ok"] = result["failed"] is None and not result["cancelled"]
+    return result
+
+
+def verification_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """백업 카탈로그에 남길 검증 결과 요약"""
+    return {
+        "ok": result["ok"],
+        "checked": result["checked"],
+        "total": result["total"],
+        "failed": result["failed"],
+        "reason": result["reason"],
+        "has_manifest": result["has_manifest"],
+        "verified_at": datetime.datetime.now().strftime("%Y%m%d_%H%M%S"),
+    }
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+커스텀 테마 배경 캐시
+창 크기에 맞게 확대/축소하고 가운데를 잘라 낸 배경 픽스맵을
+(창 크기, 밝기, 원본 이미지) 조합마다 한 번만 만들어 두고 paintEvent에서는
+캐시된 픽스맵만 그립니다. 창 크기를 조절하는 동안에는 빠른 변환으로 만든
+미리보기를 쓰고, 조절이 끝나면 고품질로 다시 만듭니다.
+
+밝기 조절은 원본이 아니라 창 크기로 줄인 이미지에 256단계 조회표(LUT)를
+적용하며, 결과는 밝기 값별로 기억해 둡니다.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QPixmap, QImage, QPainter, QColor
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 밝기 값별로 기억해 둘 결과 수 (슬라이더를 앞뒤로 움직일 때 재계산 방지)
+MAX_BRIGHTNESS_VARIANTS = 12
+
+
+def brightness_factor(brightness: int) -> float:
+    """밝기 값(0-100, 50이 원본)을 밝기 팩터(0.3 ~ 1.7)로 변환"""
+    if brightness <= 50:
+        return 0.3 + (brightness / 50.0) * 0.7
+    return 1.0 + ((brightness - 50) / 50.0) * 0.7
+
+
+@lru_cache(maxsize=101)
+def brightness_lut(brightness: int) -> bytes:
+    """채널 값 0-255에 대한 밝기 조회표 (어둡게: Multiply, 밝게: Screen 합성과 같은 결과)"""
+    factor = brightness_factor(brightness)
+    if brightness < 50:
+        gray_value = int(255 * factor)
+        return bytes(value * gray_value // 255 for value in range(256))
+    if brightness > 50:
+        screen_value = int(255 * (factor - 1.0))
+        return bytes(255 - (255 - value) * (255 - screen_value) // 255 for value in range(256))
+    return bytes(range(256))
+
+
+def apply_brightness(image: QImage, brightness: int) -> QImage:
+    """이미지에 밝기 조회표 적용 (원본은 변경하지 않음, 알파 채널 유지)"""
+    if brightness == 50 or image.isNull():
+        return image
+    image = image.convertToFormat(QImage.Format_ARGB32)
+    width, height = image.width(), image.height()
+
+    if NUMPY_AVAILABLE:
+        lut = np.frombuffer(brightness_lut(brightness), dtype=np.uint8)
+        buffer = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.bytesPerLine() * height)
+        pixels = buffer.reshape(height, image.bytesPerLine())[:, :width * 4].reshape(height, width, 4)
+        adjusted = pixels.copy()
+        # ARGB32는 메모리상 B, G, R, A 순서 - 색상 채널에만 조회표 적용
+        adjusted[..., :3] = lut[pixels[..., :3]]
+        return QImage(adjusted.tobytes(), width, height, width * 4, QImage.Format_ARGB32).copy()
+
+    # NumPy가 없으면 같은 계산을 QPainter 합성으로 수행 (창 크기 이미지라 충분히 빠름)
+    factor = brightness_factor(brightness)
+    result = image.copy()
+    painter = QPainter(result)
+    if brightness < 50:
+        painter.setCompositionMode(QPainter.CompositionMode_Multiply)
+        value = int(255 * factor)
+    else:
+        painter.setCompositionMode(QPainter.CompositionMode_Screen)
+        value = int(255 * (factor - 1.0))
+    painter.fillRect(result.rect(), QColor(value, value, value))
+    # 합성으로 바뀐 알파를 원본 알파로 되돌림
+    painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
+    painter.drawImage(0, 0, image)
+    painter.end()
+    return result
+
+
+def limit_to_screen(image: QImage, screen_size: QSize) -> QImage:
+    """화면을 덮는 데 필요한 크기보다 큰 배경 이미지를 미리 축소 (작업용 이미지)"""
+    needed = max(screen_size.width(), screen_size.height())
+    shorter = min(image.width(), image.height())
+    if needed <= 0 or shorter <= needed:
+        return image
+    scale = needed / shorter
+    return image.scaled(int(image.width() * scale), int(image.height() * scale),
+                        Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def scale_to_cover(source: QPixmap, size: QSize, smooth: bool = True) -> QPixmap:
+    """비율을 유지하며 size를 완전히 덮도록 확대/축소한 뒤 가운데를 size 크기로 잘라 반환"""
+    target_width, target_height = size.width(), size.height()
+    image_width, image_height = source.width(), source.height()
+    if target_width <= 0 or target_height <= 0 or image_width <= 0 or image_height <= 0:
+        return QPixmap()
+
+    # 윈도우를 완전히 채우면서 비율 유지 (crop 방식)
+    scale = max(target_width / image_width, target_height / image_height)
+    scaled_width = max(1, int(image_width * scale))
+    scaled_height = max(1, int(image_height * scale))
+    mode = Qt.SmoothTransformation if smooth else Qt.FastTransformation
+
+    if smooth and scale < 0.5:
+        # 큰 축소비율일 때 단계적 스케일링으로 계단현상 방지 (먼저 50%로 축소)
+        source = source.scaled(int(image_width * 0.5), int(image_height * 0.5),
+                               Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    scaled = source.scaled(scaled_width, scaled_height, Qt.IgnoreAspectRatio, mode)
+
+    # 중앙 정렬 (이미지가 윈도우보다 큰 부분은 잘라 냄)
+    x = max(0, (scaled.width() - target_width) // 2)
+    y = max(0, (scaled.height() - target_height) // 2)
+    return scaled.copy(x, y, min(target_width, scaled.width()), min(target_height, scaled.height()))
+
+
+class ScaledBackgroundCache:
+    """창 크기에 맞춘 배경 픽스맵 캐시 (밝기 값별 결과 포함)"""
+
+    def __init__(self):
+        # (너비, 높이, 원본 키) -> 밝기 적용 전 창 크기 이미지
+        self._base_key: Optional[Tuple[int, int, int]] = None
+        self._base: Optional[QImage] = None
+        # 밝기 값 -> 최종 픽스맵 (현재 창 크기/원본 기준)
+        self._variants: "OrderedDict[int, QPixmap]" = OrderedDict()
+        self._preview_key: Optional[Tuple[int, int, int, int]] = None
+        self._preview: Optional[QPixmap] = None
+        self.rebuilds = 0
+
+    def get(self, source: QPixmap, size: QSize, brightness: int = 50, preview: bool = False) -> QPixmap:
+        """캐시된 배경 반환 (없으면 생성). preview=True면 빠른 변환 미리보기 사용"""
+        base_key = (size.width(), size.height(), source.cacheKey())
+        if base_key == self._base_key:
+            pixmap = self._variants.get(brightness)
+            if pixmap is not None:
+                self._variants.move_to_end(brightness)
+                return pixmap
+            if self._base is not None:
+                # 창 크기 이미지에만 조회표 적용 (원본 복사 없음)
+                return self._remember(brightness, apply_brightness(self._base, brightness))
+
+        if preview:
+            preview_key = base_key + (brightness,)
+            if preview_key != self._preview_key or self._preview is None:
+                # 직전 고품질 결과(같은 원본/밝기)가 있으면 그것을 빠르게 늘려 사용 (원본 전체 재스케일 방지)
+                last = self._variants.get(brightness)
+                if last is not None and self._base_key is not None and self._base_key[2] == base_key[2]:
+                    self._preview = scale_to_cover(last, size, smooth=False)
+                else:
+                    fast = scale_to_cover(source, size, smooth=False)
+                    self._preview = QPixmap.fromImage(apply_brightness(fast.toImage(), brightness))
+                self._preview_key = preview_key
+            return self._preview
+
+        self._base = scale_to_cover(source, size, smooth=True).toImage()
+        self._base_key = base_key
+        self._variants.clear()
+        self._preview = None
+        self._preview_key = None
+        self.rebuilds += 1
+        return self._remember(brightness, apply_brightness(self._base, brightness))
+
+    def _remember(self, brightness: int, image: QImage) -> QPixmap:
+        pixmap = QPixmap.fromImage(image)
+        self._variants[brightness] = pixmap
+        while len(self._variants) > MAX_BRIGHTNESS_VARIANTS:
+            self._variants.popitem(last=False)
+        return pixmap
+
+    def clear(self) -> None:
+        self._base_key = None
+        self._base = None
+        self._variants.clear()
+        self._preview_key = None
+        self._preview = None
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백그라운드 작업 스레드
+UI 스레드를 막지 않도록 오래 걸리는 유지보수 작업을 QThread로 실행합니다.
+"""
+
+import os
+import time
+import shutil
+import threading
+
+from PySide6.QtCore import QThread, Signal
+
+from trash_queue import delete_batch
+from image_metadata import extract_prompt_info
+from folder_ingest import plan_folder_ingest
+from backup_archive import write_backup, write_incremental_backup, verify_backup, BackupReader, BackupCancelled, page_image_names, DEFAULT_COMPRESSION
+from archive_integrity import failed_result
+from backup_catalog import hash_backup_file
+from snapshot_scheduler import prune_snapshots
+from book_export import write_book_export
+
+
+class ImageRefReconcileThread(QThread):
+    """이미지 참조 전체 재검사 스레드 (요청 시에만 실행)"""
+    progress_updated = Signal(int, int)  # 처리한 파일 수, 전체 파일 수
+    reconcile_finished = Signal(object)  # 결과 딕셔너리
+
+    def __init__(self, ref_index, books_snapshot, images_dir):
+        super().__init__()
+        self.ref_index = ref_index
+        self.books_snapshot = books_snapshot
+        self.images_dir = images_dir
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            result = self.ref_index.reconcile(
+                self.books_snapshot,
+                self.images_dir,
+                progress_callback=lambda done, total: self.progress_updated.emit(done, total),
+                is_cancelled=lambda: self._cancelled
+            )
+        except Exception as e:
+            result = {"error": str(e)}
+        self.reconcile_finished.emit(result)
+
+
+class TrashQueueThread(QThread):
+    """삭제 대기열을 묶음 단위로 처리하는 상주 스레드"""
+    progress_updated = Signal(int, int)  # 이번 실행에서 처리한 수, 전체(처리 + 대기) 수
+    batch_deleted = Signal(object)  # 삭제(휴지통 이동)된 경로 목록
+    queue_drained = Signal()
+
+    def __init__(self, queue, batch_size=64, use_trash=True, should_delete=None):
+        super().__init__()
+        self.queue = queue
+        # 삭제 직전 확인 (예: 그 사이 다시 참조된 이미지는 건너뜀)
+        self.should_delete = should_delete
+        self.batch_size = batch_size
+        self.use_trash = use_trash
+        self._wake = threading.Event()
+        self._stopping = False
+
+    def wake(self):
+        """새 항목이 추가되었음을 알림"""
+        self._wake.set()
+
+    def stop(self):
+        """현재 묶음까지만 처리하고 종료 (남은 대기열은 디스크에 유지)
+
+        실행 중인 QThread가 파괴되지 않도록 묶음이 끝날 때까지 제한 없이 기다립니다.
+        """
+        self._stopping = True
+        self._wake.set()
+        self.wait()
+
+    def run(self):
+        self.setPriority(QThread.LowPriority)
+        while not self._stopping:
+            batch = self.queue.peek_batch(self.batch_size)
+            if not batch:
+                self.queue_drained.emit()
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            with self.queue.deletion_lock:
+                # 잠금 안에서 다시 확인: 그 사이 가져오기가 재사용한 파일은 대기열에서 빠져 있음
+                pending = self.queue.peek_batch(self.batch_size)
+                batch = [path for path in pending if self.should_delete is None or self.should_delete(path)]
+                skipped = [path for path in pending if path not in batch]
+                if skipped:
+                    self.queue.discard(skipped)
+                if not batch:
+                    continue
+                removed, failed = delete_batch(batch, use_trash=self.use_trash)
+                if removed:
+                    self.queue.mark_done(removed)
+            if removed:
+                self.batch_deleted.emit(removed)
+            self.progress_updated.emit(self.queue.completed, self.queue.completed + len(self.queue))
+            if failed:
+                # 실패한 파일만 남은 경우 다음 실행 또는 다음 추가 시 재시도
+                self.queue.defer(failed)
+                if len(failed) == len(batch):
+                    self._wake.wait()
+                    self._wake.clear()
+
+
+class ImageImportThread(QThread):
+    """대량 이미지 가져오기 파이프라인 실행 스레드"""
+    progress_updated = Signal(int, int)  # 처리한 파일 수, 전체 파일 수
+    import_finished = Signal(object)  # ImportResult
+
+    def __init__(self, pipeline, paths):
+        super().__init__()
+        self.pipeline = pipeline
+        self.paths = list(paths)
+
+    def cancel(self):
+        self.pipeline.cancel()
+
+    def run(self):
+        result = self.pipeline.run(
+            self.paths,
+            progress_callback=lambda done, total: self.progress_updated.emit(done, total)
+        )
+        self.import_finished.emit(result)
+
+
+class MetadataExtractThread(QThread):
+    """이미지 한 장의 메타데이터를 읽어 캐시에 저장하는 스레드 (EXIF 오버레이용)"""
+    metadata_ready = Signal(str, object)  # 이미지 경로, 메타데이터 딕셔너리 (실패 시 None)
+
+    def __init__(self, cache, image_path):
+        super().__init__()
+        self.cache = cache
+        self.image_path = image_path
+
+    def run(self):
+        if self.cache is not None:
+            entry = self.cache.extract(self.image_path)
+        else:
+            try:
+                entry = extract_prompt_info(self.image_path)
+            except Exception as e:
+                print(f"[ERROR] 메타데이터 추출 실패 {self.image_path}: {e}")
+                entry = None
+        self.metadata_ready.emit(self.image_path, entry)
+
+
+class PromptIndexThread(QThread):
+    """이미지 내장 프롬프트 색인 스레드 (변경된 이미지만 프로세스 풀에서 추출)"""
+    progress_updated = Signal(int, int)  # 처리한 이미지 수, 대상 이미지 수
+    index_finished = Signal(object)  # 결과 딕셔너리
+
+    def __init__(self, prompt_index, books_snapshot, metadata_cache=None):
+        super().__init__()
+        self.prompt_index = prompt_index
+        self.books_snapshot = books_snapshot
+        self.metadata_cache = metadata_cache
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        self.setPriority(QThread.LowPriority)
+        try:
+            pending = self.prompt_index.collect_pending(self.books_snapshot)
+            result = self.prompt_index.build(
+                pending,
+                metadata_cache=self.metadata_cache,
+                progress_callback=lambda done, total: self.progress_updated.emit(done, total),
+                is_cancelled=lambda: self._cancelled
+            )
+        except Exception as e:
+            result = {"error": str(e)}
+        self.index_finished.emit(result)
+
+
+class FolderIngestScanThread(QThread):
+    """폴더 가져오기 계획(스캔 + 프롬프트 추출 + 묶기) 스레드"""
+    progress_updated = Signal(int, int)  # 처리한 이미지 수, 전체 이미지 수
+    plan_ready = Signal(object)  # IngestPlan (오류 시 오류 메시지 문자열)
+
+    def __init__(self, root_dir, metadata_cache=None):
+        super().__init__()
+        self.root_dir = root_dir
+        self.metadata_cache = metadata_cache
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        try:
+            plan = plan_folder_ingest(
+                self.root_dir,
+                metadata_cache=self.metadata_cache,
+                progress_callback=lambda done, total: self.progress_updated.emit(done, total),
+                is_cancelled=lambda: self._cancelled
+            )
+        except Exception as e:
+            plan = str(e)
+        self.plan_ready.emit(plan)
+
+
+class PerceptualHashThread(QThread):
+    """라이브러리 이미지 중 지각 해시가 없는 것의 썸네일을 만들어 해시 색인 채우기"""
+    progress_updated = Signal(int, int)  # 처리한 이미지 수, 대상 이미지 수
+    hashing_finished = Signal(object)  # 결과 딕셔너리
+
+    def __init__(self, hash_index, page_cache, image_paths):
+        super().__init__()
+        self.hash_index = hash_index
+        self.page_cache = page_cache
+        self.image_paths = image_paths
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        self.setPriority(QThread.LowPriority)
+        result = {"total": 0, "hashed": 0, "pruned": 0, "cancelled": False}
+        try:
+            result["pruned"] = self.hash_index.prune(self.image_paths)
+            pending = [path for path in self.image_paths if not self.hash_index.is_current(path)]
+            result["total"] = len(pending)
+            for i, path in enumerate(pending, 1):
+                if self._cancelled:
+                    result["cancelled"] = True
+                    break
+                # 썸네일 캐시를 거치면서 해시가 계산됨 (디스크 썸네일이 있으면 원본을 읽지 않음)
+                if self.page_cache.get_thumbnail(path) is not None:
+                    result["hashed"] += 1
+                if i % 20 == 0 or i == len(pending):
+                    self.progress_updated.emit(i, len(pending))
+            self.hash_index.save()
+        except Exception as e:
+            result["error"] = str(e)
+        self.hashing_finished.emit(result)
+
+
+class ImageCompactionThread(QThread):
+    """images 폴더 무손실 압축 스레드 (ImageCompactor.run)"""
+    progress_updated = Signal(int, int, object)  # 처리한 이미지 수, 대상 이미지 수, 절약한 바이트
+    compaction_finished = Signal(object)  # 결과 딕셔너리
+
+    def __init__(self, compactor):
+        super().__init__()
+        self.compactor = compactor
+        # 종료 시 시그널 없이 결과를 읽을 수 있도록 보관
+        self.result = None
+
+    def cancel(self):
+        self.compactor.cancel()
+
+    def run(self):
+        self.setPriority(QThread.LowPriority)
+        try:
+            result = self.compactor.run(
+                progress_callback=lambda done, total, saved: self.progress_updated.emit(done, total, saved)
+            )
+        except Exception as e:
+            result = {"error": str(e), "mapping": {}, "obsolete_files": []}
+        self.result = result
+        self.compaction_finished.emit(result)
+
+
+class _TransferMeter:
+    """처리량(MB/s) 계산용 바이트 카운터"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.bytes = 0
+
+    def add(self, count):
+        self.bytes += count
+
+    @property
+    def mb_per_second(self):
+        elapsed = time.monotonic() - self.started
+        return (self.bytes / (1024 * 1024)) / elapsed if elapsed > 0 else 0.0
+
+
+class BackupJobThread(QThread):
+    """북 리스트 백업 스레드 (취소 시 임시 파일과 이번에 만든 블롭을 지움)"""
+    progress_updated = Signal(int, int, float)  # 처리한 이미지 수, 전체 이미지 수, MB/s
+    verify_started = Signal()  # 기록을 마치고 무결성 검증 시작
+    backup_finished = Signal(object)  # {"metadata", "sha256", "verify", "cancelled", "error", "elapsed", "mb_per_second"}
+
+    def __init__(self, backup_path, books, images_dir, version, timestamp, image_names, blob_store=None,
+                 compression=DEFAULT_COMPRESSION):
+        super().__init__()
+        self.backup_path = backup_path
+        # 작업 중 UI에서 데이터가 바뀌어도 영향이 없도록 호출자가 넘긴 사본을 사용
+        self.books = books
+        self.images_dir = images_dir
+        self.version = version
+        self.timestamp = timestamp
+        self.image_names = image_names
+        # 있으면 증분 백업
+        self.blob_store = blob_store
+        self.compression = compression
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        self.setPriority(QThread.LowPriority)
+        self.backup_finished.emit(self._write_backup())
+
+    def _write_backup(self):
+        meter = _TransferMeter()
+        result = {"metadata": None, "sha256": None, "verify": None, "cancelled": False, "error": None}
+        kwargs = dict(
+            image_names=self.image_names,
+            progress_callback=lambda done, total: self.progress_updated.emit(done, total, meter.mb_per_second),
+            is_cancelled=lambda: self._cancelled,
+            bytes_callback=meter.add,
+            compression=self.compression,
+        )
+        try:
+            if self.blob_store is not None:
+                result["metadata"] = write_incremental_backup(
+                    self.backup_path, self.books, self.images_dir, self.version, self.timestamp,
+                    self.blob_store, **kwargs)
+            else:
+                result["metadata"] = write_backup(
+                    self.backup_path, self.books, self.images_dir, self.version, self.timestamp, **kwargs)
+            # 카탈로그에 기록할 백업 파일 해시 (취소하면 해시 없이 백업만 유지)
+            result["sha256"] = hash_backup_file(self.backup_path, is_cancelled=lambda: self._cancelled)
+        except BackupCancelled:
+            result["cancelled"] = True
+        except Exception as e:
+            result["error"] = str(e)
+        result["elapsed"] = time.monotonic() - meter.started
+        result["mb_per_second"] = meter.mb_per_second
+        if result["metadata"] is not None:
+            # 방금 만든 백업을 다시 읽어 멤버/블롭 해시 확인 (취소하면 검증만 건너뜀, 백업은 유지)
+            self.verify_started.emit()
+            try:
+                verify = verify_backup(
+                    self.backup_path, self.blob_store,
+                    progress_callback=lambda done, total: self.progress_updated.emit(done, total, 0.0),
+                    is_cancelled=lambda: self._cancelled)
+            except Exception as e:
+                # 예외로 스레드가 끝나면 backup_finished가 오지 않아 작업 상태가 풀리지 않음
+                print(f"[ERROR] 백업 무결성 검증 실패: {e}")
+                verify = failed_result(self.backup_path, f"검증 중 오류: {e}")
+            if not verify["cancelled"]:
+                result["verify"] = verify
+        return result
+
+
+class SnapshotJobThread(BackupJobThread):
+    """자동 스냅샷 스레드: 증분 백업 후 보존 규칙/디스크 예산에 맞춰 오래된 자동 스냅샷 정리
+
+    유휴 우선순위로 실행되며, 정리한 스냅샷은 카탈로그에서도 바로 뺍니다.
+    """
+
+    def __init__(self, backup_path, books, images_dir, version, timestamp, image_names,
+                 blob_store, settings, catalog, compression=DEFAULT_COMPRESSION):
+        super().__init__(backup_path, books, images_dir, version, timestamp, image_names, blob_store=blob_store,
+                         compression=compression)
+        self.settings = dict(settings)
+        self.catalog = catalog
+
+    def run(self):
+        self.setPriority(QThread.IdlePriority)
+        result = self._write_backup()
+        result["pruned"] = []
+        result["freed"] = 0
+        if result["verify"] is not None and result["verify"]["ok"] and not self._cancelled:
+            # 검증에 실패한 스냅샷이 생기면 이전 스냅샷을 지우지 않음
+            try:
+                result["pruned"], result["freed"] = prune_snapshots(
+                    os.path.dirname(self.backup_path), self.blob_store, self.settings,
+                    on_removed=self.catalog.remove, is_cancelled=lambda: self._cancelled)
+            except Exception as e:
+                # 읽을 수 없는 백업이 있으면 블롭을 지우지 않음 (다음 스냅샷 때 다시 시도)
+                print(f"[ERROR] 자동 스냅샷 정리 실패: {e}")
+        self.backup_finished.emit(result)
+
+
+class RestoreJobThread(QThread):
+    """백업 복구 스레드: 이미지를 임시 폴더(staging_dir)에 풀어 두기만 함
+
+    현재 라이브러리는 건드리지 않으므로 취소하면 임시 폴더만 지우면 됩니다.
+    실제 교체는 완료 후 메인 스레드에서 수행합니다.
+    """
+    progress_updated = Signal(int, int, float)  # 복원한 이미지 수, 전체 이미지 수, MB/s
+    restore_finished = Signal(object)  # {"books", "staged", "cancelled", "error", ...}
+
+    def __init__(self, backup_path, staging_dir):
+        super().__init__()
+        self.backup_path = backup_path
+        self.staging_dir = staging_dir
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        meter = _TransferMeter()
+        result = {"books": None, "staged": [], "cancelled": False, "error": None}
+        try:
+            os.makedirs(self.staging_dir, exist_ok=True)
+            with BackupReader(self.backup_path) as reader:
+                result["books"] = reader.load_books()
+                result["staged"] = reader.extract_images(
+                    self.staging_dir,
+                    progress_callback=lambda done, total: self.progress_updated.emit(done, total, meter.mb_per_second),
+                    is_cancelled=lambda: self._cancelled,
+                    bytes_callback=meter.add,
+                )
+        except BackupCancelled:
+            result["cancelled"] = True
+        except Exception as e:
+            result["error"] = str(e)
+        if result["cancelled"] or result["error"]:
+            # 되돌리기: 풀어 둔 이미지 삭제
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            result["staged"] = []
+        result["elapsed"] = time.monotonic() - meter.started
+        result["mb_per_second"] = meter.mb_per_second
+        self.restore_finished.emit(result)
+
+
+class SelectiveRestoreThread(QThread):
+    """백업에서 고른 북이 참조하는 이미지만 저장소로 가져오는 스레드"""
+    progress_updated = Signal(int, int, float)  # 가져온 이미지 수, 대상 이미지 수, MB/s
+    restore_finished = Signal(object)  # {"mapping", "cancelled", "error", ...}
+
+    def __init__(self, backup_path, books, image_store):
+        super().__init__()
+        self.backup_path = backup_path
+        # 복원할 북 데이터 (메인 스레드에서 백업의 library.json을 읽어 고른 것)
+        self.books = books
+        self.image_store = image_store
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        meter = _TransferMeter()
+        result = {"mapping": {}, "cancelled": False, "error": None}
+        try:
+            with BackupReader(self.backup_path) as reader:
+                reader.import_images(
+                    page_image_names(self.books), self.image_store,
+                    progress_callback=lambda done, total: self.progress_updated.emit(done, total, meter.mb_per_second),
+                    is_cancelled=lambda: self._cancelled,
+                    bytes_callback=meter.add,
+                    mapping=result["mapping"],
+                )
+        except BackupCancelled:
+            result["cancelled"] = True
+        except Exception as e:
+            result["error"] = str(e)
+        result["elapsed"] = time.monotonic() - meter.started
+        result["mb_per_second"] = meter.mb_per_second
+        self.restore_finished.emit(result)
+
+
+class BookExportThread(QThread):
+    """선택한 북을 zip으로 내보내는 스레드 (해시/읽기는 스레드 풀, 기록은 이 스레드)"""
+    progress_updated = Signal(int, int, float)  # 처리한 이미지 수, 전체 이미지 수, MB/s
+    export_finished = Signal(object)  # {"stats", "cancelled", "error", "elapsed", "mb_per_second"}
+
+    def __init__(self, export_path, books, resolve, compression=DEFAULT_COMPRESSION):
+        super().__init__()
+        self.export_path = export_path
+        # (북 이름, 북 데이터 사본) 목록
+        self.books = books
+        self.resolve = resolve
+        self.compression = compression
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        meter = _TransferMeter()
+        result = {"stats": None, "cancelled": False, "error": None}
+        try:
+            result["stats"] = write_book_export(
+                self.export_path, self.books, self.resolve,
+                progress_callback=lambda done, total: self.progress_updated.emit(done, total, meter.mb_per_second),
+                is_cancelled=lambda: self._cancelled,
+                bytes_callback=meter.add,
+                compression=self.compression,
+            )
+        except BackupCancelled:
+            result["cancelled"] = True
+        except Exception as e:
+            result["error"] = str(e)
+        result["elapsed"] = time.monotonic() - meter.started
+        result["mb_per_second"] = meter.mb_per_second
+        self.export_finished.emit(result)
+
+
+class VerifyArchiveThread(QThread):
+    """백업(.pbk)/북 내보내기(zip) 파일 무결성 검증 스레드"""
+    progress_updated = Signal(int, int)  # 확인한 항목 수, 전체 항목 수
+    verify_finished = Signal(object)  # verify_archive 결과 + {"elapsed"}
+
+    def __init__(self, archive_path):
+        super().__init__()
+        self.archive_path = archive_path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        started = time.monotonic()
+        try:
+            result = verify_backup(
+                self.archive_path,
+                progress_callback=self.progress_updated.emit,
+                is_cancelled=lambda: self._cancelled)
+        except Exception as e:
+            print(f"[ERROR] 무결성 검증 실패: {e}")
+            result = failed_result(self.archive_path, f"검증 중 오류: {e}")
+        result["elapsed"] = time.monotonic() - started
+        self.verify_finished.emit(result)
@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+북 리스트 백업 파일(.pbk) 읽기/쓰기
+
+새 형식(format 2):
+    metadata.json   백업 정보 (생성 시각, 버전, 북/이미지 개수)
+    library.json    북 데이터
+    images/<파일명>  이미지 원본 그대로 (PNG/JPEG/WebP 등 이미 압축된 형식은 STORED)
+
+이미지는 ZipFile.open(..., 'w')로 조각 단위로 복사하므로 라이브러리 크기와 관계없이
+메모리 사용량이 일정합니다. 이전 형식(backup.json 안에 base64 이미지)도 읽을 수 있습니다.
+
+증분 백업은 이미지 대신 manifest.json(파일명 -> SHA-256)만 담고, 이미지 내용은
+backup/blobs/ 아래 해시 이름으로 한 번만 저장해 여러 백업이 함께 씁니다.
+
+모든 백업은 마지막 멤버로 integrity.json(멤버별 SHA-256)을 담습니다 (archive_integrity 참고).
+"""
+
+import os
+import io
+import json
+import base64
+import zipfile
+import tempfile
+from typing import Dict, List, Optional, Any, Callable, BinaryIO, Iterable, Set, Tuple
+
+from image_store import CHUNK_SIZE, ContentAddressedImageStore, hash_file, iter_page_image_refs
+from archive_integrity import HashingWriter, IntegrityManifest, verify_archive
+
+BACKUP_FORMAT = 2
+METADATA_NAME = "metadata.json"
+LIBRARY_NAME = "library.json"
+LEGACY_NAME = "backup.json"
+MANIFEST_NAME = "manifest.json"
+BLOB_DIR_NAME = "blobs"
+IMAGE_PREFIX = "images/"
+# 백업에 포함할 이미지 확장자
+BACKUP_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+# 다시 압축해도 거의 줄지 않는 형식 (STORED로 저장)
+PRECOMPRESSED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+# 압축 설정: 빠르게 / 균형 / 작게 (멤버별 코덱은 내용 종류와 크기로 자동 선택)
+COMPRESSION_PROFILES = ("fast", "balanced", "small")
+DEFAULT_COMPRESSION = "balanced"
+# 이보다 작은 멤버는 압축하지 않음 (압축 헤더가 더 큼)
+TINY_MEMBER_BYTES = 512
+# "작게"에서 이보다 큰 텍스트는 BZIP2 (작은 것은 DEFLATE 9가 더 작고 빠름)
+BZIP2_MIN_BYTES = 64 * 1024
+# "균형"에서 이보다 큰 비압축 이미지(BMP)는 DEFLATE 1로 속도 우선
+LARGE_RAW_BYTES = 32 * 1024 * 1024
+
+
+class BackupCancelled(Exception):
+    """사용자가 백업/복구를 취소함"""
+
+
+def list_backup_images(images_dir: str, names: Optional[List[str]] = None) -> List[str]:
+    """백업 대상 이미지 파일 이름 목록 (names가 있으면 그 목록에서 고름)"""
+    if names is None:
+        names = os.listdir(images_dir) if os.path.isdir(images_dir) else []
+    return sorted(name for name in names
+                  if not name.startswith('.') and name.lower().endswith(BACKUP_IMAGE_EXTENSIONS))
+
+
+def _codec_available(compress_type: int) -> bool:
+    """BZIP2/LZMA는 파이썬 빌드에 따라 모듈이 없을 수 있음"""
+    try:
+        if compress_type == zipfile.ZIP_BZIP2:
+            import bz2  # noqa: F401
+        elif compress_type == zipfile.ZIP_LZMA:
+            import lzma  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def choose_compression(name: str, size: int, profile: str = DEFAULT_COMPRESSION) -> Tuple[int, Optional[int]]:
+    """멤버의 (압축 방식, 압축 레벨) 선택
+
+    이미 압축된 이미지와 아주 작은 멤버는 STORED, 그 외에는 설정과 내용 종류/크기에 따라
+    DEFLATE(레벨 1~9), BZIP2(텍스트), LZMA(비압축 이미지) 중에서 고릅니다.
+    """
+    lower = name.lower()
+    if lower.endswith(PRECOMPRESSED_EXTENSIONS) or size < TINY_MEMBER_BYTES:
+        return zipfile.ZIP_STORED, None
+    if profile == "fast":
+        return zipfile.ZIP_DEFLATED, 1
+    is_text = lower.endswith(('.json', '.txt'))
+    if profile == "small":
+        if is_text:
+            choice = (zipfile.ZIP_BZIP2, 9) if size >= BZIP2_MIN_BYTES else (zipfile.ZIP_DEFLATED, 9)
+        else:
+            choice = (zipfile.ZIP_LZMA, None)
+        return choice if _codec_available(choice[0]) else (zipfile.ZIP_DEFLATED, 9)
+    if not is_text and size >= LARGE_RAW_BYTES:
+        return zipfile.ZIP_DEFLATED, 1
+    return zipfile.ZIP_DEFLATED, 6
+
+
+def apply_compression(info: zipfile.ZipInfo, size: int, profile: str = DEFAULT_COMPRESSION) -> None:
+    """ZipInfo에 선택한 압축 방식/레벨 지정 (ZipFile.open(info, 'w')와 writestr 모두 사용)"""
+    info.compress_type, level = choose_compression(info.filename, size, profile)
+    # 파이썬 3.13부터는 compress_level이지만 _compresslevel도 그대로 동작
+    info._compresslevel = level
+
+
+def _write_json(zipf: zipfile.ZipFile, integrity: IntegrityManifest, name: str, text: str,
+                profile: str) -> None:
+    compress_type, level = choose_compression(name, len(text), profile)
+    integrity.writestr(zipf, name, text, compress_type, level)
+
+
+def _copy_stream(src: BinaryIO, dst: BinaryIO, on_bytes: Optional[Callable[[int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+    copied = 0
+    for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+        if is_cancelled and is_cancelled():
+            raise BackupCancelled()
+        dst.write(chunk)
+        copied += len(chunk)
+        if on_bytes:
+            on_bytes(len(chunk))
+    return copied
+
+
+def write_backup(backup_path: str, books: Dict[str, Any], images_dir: str, version: str,
+                 timestamp: str, image_names: Optional[List[str]] = None,
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 bytes_callback: Optional[Callable[[int], None]] = None,
+                 compression: str = DEFAULT_COMPRESSION) -> Dict[str, Any]:
+    """새 형식 백업 파일 작성 (임시 파일에 쓴 뒤 원자적으로 교체, 취소 시 임시 파일 삭제)
+
+    progress_callback은 (처리한 이미지 수, 전체 이미지 수)로, bytes_callback은 복사한 바이트 수로 호출됩니다.
+    compression은 COMPRESSION_PROFILES 중 하나입니다.
+    """
+    names = list_backup_images(images_dir, image_names)
+    total = len(names)
+    written: List[str] = []
+    total_bytes = 0
+    part_path = backup_path + ".part"
+    integrity = IntegrityManifest()
+    try:
+        with zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True) as zipf:
+            library = {"version": version, "timestamp": timestamp, "books": books}
+            _write_json(zipf, integrity, LIBRARY_NAME, json.dumps(library, ensure_ascii=False), compression)
+
+            for i, name in enumerate(names, 1):
+                if is_cancelled and is_cancelled():
+                    raise BackupCancelled()
+                src_path = os.path.join(images_dir, name)
+                try:
+                    info = zipfile.ZipInfo.from_file(src_path, IMAGE_PREFIX + name)
+                    apply_compression(info, info.file_size, compression)
+                    with open(src_path, 'rb') as src, zipf.open(info, 'w', force_zip64=True) as dst:
+                        hashing = HashingWriter(dst)
+                        total_bytes += _copy_stream(src, hashing, bytes_callback, is_cancelled)
+                    integrity.add_digest(info.filename, hashing.hexdigest())
+                    written.append(name)
+                except OSError as e:
+                    print(f"[ERROR] 이미지 백업 실패 {name}: {e}")
+                if progress_callback:
+                    progress_callback(i, total)
+
+            metadata = {
+                "created": timestamp,
+                "version": version,
+                "format": BACKUP_FORMAT,
+                "book_count": len(books),
+                "image_count": len(written),
+                "image_bytes": total_bytes,
+                "compression": compression,
+            }
+            _write_json(zipf, integrity, METADATA_NAME, json.dumps(metadata, ensure_ascii=False, indent=2), compression)
+            integrity.write(zipf)
+        os.replace(part_path, backup_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    return metadata
+
+
+class BlobStore:
+    """증분 백업용 내용 주소 저장소 (backup/blobs/<해시 앞 2자리>/<해시>)"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def has(self, digest: str) -> bool:
+        return os.path.exists(self.path_for(digest))
+
+    def put_file(self, src_path: str, digest: str,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 bytes_callback: Optional[Callable[[int], None]] = None) -> int:
+        """파일을 저장소에 복사하고 기록한 바이트 수 반환 (이미 있으면 0)"""
+        dest_path = self.path_for(digest)
+        if os.path.exists(dest_path):
+            return 0
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".blob_", dir=os.path.dirname(dest_path))
+        try:
+            with open(src_path, 'rb') as src, os.fdopen(fd, 'wb') as dst:
+                copied = _copy_stream(src, dst, bytes_callback, is_cancelled)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return copied
+
+    def open(self, digest: str) -> BinaryIO:
+        return open(self.path_for(digest), 'rb')
+
+    def iter_digests(self) -> Iterable[str]:
+        if not os.path.isdir(self.root):
+            return
+        for prefix in os.listdir(self.root):
+            folder = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                if not name.startswith('.'):
+                    yield name
+
+    def remove(self, digests: Iterable[str]) -> Tuple[int, int]:
+        """블롭 삭제 후 (삭제 개수, 바이트) 반환"""
+        removed = 0
+        freed = 0
+        for digest in digests:
+            path = self.path_for(digest)
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                removed += 1
+                freed += size
+            except OSError as e:
+                print(f"[ERROR] 백업 블롭 삭제 실패 {digest}: {e}")
+        return removed, freed
+
+    def collect_garbage(self, backup_dir: str) -> Tuple[int, int]:
+        """남아 있는 증분 백업 어디에서도 참조하지 않는 블롭 삭제"""
+        referenced = referenced_blobs(backup_dir)
+        return self.remove([digest for digest in self.iter_digests() if digest not in referenced])
+
+
+def image_digest(path: str) -> str:
+    """이미지 내용 해시 (저장소 이미지는 파일 이름에서 바로 얻음)"""
+    return ContentAddressedImageStore.digest_from_path(path) or hash_file(path)
+
+
+def write_incremental_backup(backup_path: str, books: Dict[str, Any], images_dir: str, version: str,
+                             timestamp: str, blob_store: BlobStore,
+                             image_names: Optional[List[str]] = None,
+                             progress_callback: Optional[Callable[[int, int], None]] = None,
+                             is_cancelled: Optional[Callable[[], bool]] = None,
+                             bytes_callback: Optional[Callable[[int], None]] = None,
+                             compression: str = DEFAULT_COMPRESSION) -> Dict[str, Any]:
+    """증분 백업 작성: 새 이미지만 블롭 저장소에 복사하고 .pbk에는 매니페스트만 기록
+
+    블롭은 원본 그대로 저장하므로 compression은 .pbk 안의 JSON에만 적용됩니다.
+
+    취소되거나 실패하면 이번 실행에서 새로 만든 블롭과 임시 파일을 지웁니다.
+    """
+    names = list_backup_images(images_dir, image_names)
+    total = len(names)
+    manifest: Dict[str, str] = {}
+    created: List[str] = []
+    new_bytes = 0
+    total_bytes = 0
+    part_path = backup_path + ".part"
+    try:
+        for i, name in enumerate(names, 1):
+            if is_cancelled and is_cancelled():
+                raise BackupCancelled()
+            src_path = os.path.join(images_dir, name)
+            try:
+                digest = image_digest(src_path)
+                copied = blob_store.put_file(src_path, digest, is_cancelled=is_cancelled,
+                                             bytes_callback=bytes_callback)
+                if copied:
+                    created.append(digest)
+                    new_bytes += copied
+                total_bytes += os.path.getsize(src_path)
+                manifest[name] = digest
+            except OSError as e:
+                print(f"[ERROR] 이미지 백업 실패 {name}: {e}")
+            if progress_callback:
+                progress_callback(i, total)
+
+        metadata = {
+            "created": timestamp,
+            "version": version,
+            "format": BACKUP_FORMAT,
+            "incremental": True,
+            "book_count": len(books),
+            "image_count": len(manifest),
+            "image_bytes": total_bytes,
+            "new_bytes": new_bytes,
+            "compression": compression,
+        }
+        integrity = IntegrityManifest()
+        with zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            library = {"version": version, "timestamp": timestamp, "books": books}
+            _write_json(zipf, integrity, LIBRARY_NAME, json.dumps(library, ensure_ascii=False), compression)
+            # 이미지 해시는 manifest.json에 있으므로 블롭은 검증 때 그 해시와 비교
+            _write_json(zipf, integrity, MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False), compression)
+            _write_json(zipf, integrity, METADATA_NAME, json.dumps(metadata, ensure_ascii=False, indent=2), compression)
+            integrity.write(zipf)
+        os.replace(part_path, backup_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        blob_store.remove(created)
+        raise
+    return metadata
+
+
+def read_manifest(backup_path: str) -> Optional[Dict[str, str]]:
+    """증분 백업의 매니페스트 (전체 백업이면 None)"""
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        if MANIFEST_NAME not in zipf.namelist():
+            return None
+        return json.loads(zipf.read(MANIFEST_NAME).decode('utf-8'))
+
+
+def referenced_blobs(backup_dir: str) -> Set[str]:
+    """backup_dir의 증분 백업들이 참조하는 블롭 해시 집합"""
+    referenced: Set[str] = set()
+    for name in os.listdir(backup_dir):
+        if not name.endswith('.pbk'):
+            continue
+        try:
+            manifest = read_manifest(os.path.join(backup_dir, name))
+        except Exception as e:
+            # 읽을 수 없는 백업이 참조하는 블롭을 지우지 않도록 GC를 중단
+            raise RuntimeError(f"백업 파일을 읽을 수 없어 정리를 중단합니다: {name} ({e})")
+        if manifest:
+            referenced.update(manifest.values())
+    return referenced
+
+
+def _ref_name(ref: str) -> str:
+    """페이지 이미지 참조에서 백업 멤버 이름(파일 이름) 추출"""
+    return os.path.basename(ref.replace('\\', '/'))
+
+
+def page_image_names(books: Dict[str, Any]) -> List[str]:
+    """북들의 페이지가 참조하는 이미지 파일 이름 (중복 제거, 순서 유지)"""
+    names: Dict[str, None] = {}
+    for book_data in books.values():
+        if not isinstance(book_data, dict):
+            continue
+        for page in book_data.get("pages", []):
+            for ref in iter_page_image_refs(page):
+                name = _ref_name(ref)
+                if name:
+                    names[name] = None
+    return list(names)
+
+
+def remap_book_images(books: Dict[str, Any], mapping: Dict[str, str]) -> None:
+    """페이지 이미지 참조를 복원된 저장소 참조로 교체 (백업에 없던 이미지는 제거)"""
+    for book_data in books.values():
+        if not isinstance(book_data, dict):
+            continue
+        for page in book_data.get("pages", []):
+            image_path = page.get("image_path")
+            if image_path:
+                page["image_path"] = mapping.get(_ref_name(image_path), "")
+            extras = page.get("additional_images")
+            if extras:
+                page["additional_images"] = list(dict.fromkeys(
+                    mapping[_ref_name(ref)] for ref in extras if ref and _ref_name(ref) in mapping))
+
+
+class _MeteredStream:
+    """읽은 바이트 수 보고 및 취소 확인용 스트림 래퍼"""
+
+    def __init__(self, stream: BinaryIO, bytes_callback: Optional[Callable[[int], None]],
+                 is_cancelled: Optional[Callable[[], bool]]):
+        self._stream = stream
+        self._bytes_callback = bytes_callback
+        self._is_cancelled = is_cancelled
+
+    def read(self, size: int = -1) -> bytes:
+        if self._is_cancelled and self._is_cancelled():
+            raise BackupCancelled()
+        data = self._stream.read(size)
+        if data and self._bytes_callback:
+            self._bytes_callback(len(data))
+        return data
+
+
+def verify_backup(backup_path: str, blob_store: Optional[BlobStore] = None,
+                  progress_callback: Optional[Callable[[int, int], None]] = None,
+                  is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """백업 파일 무결성 검증 (증분 백업이면 참조하는 블롭 내용도 해시로 확인)"""
+    external: Dict[str, Tuple[str, str]] = {}
+    try:
+        manifest = read_manifest(backup_path)
+    except Exception:
+        # 열 수 없는 파일은 verify_archive가 실패 사유를 기록
+        manifest = None
+    if manifest:
+        blob_store = blob_store or BlobStore(
+            os.path.join(os.path.dirname(os.path.abspath(backup_path)), BLOB_DIR_NAME))
+        for digest in set(manifest.values()):
+            external[f"{BLOB_DIR_NAME}/{digest}"] = (blob_store.path_for(digest), digest)
+    return verify_archive(backup_path, external, progress_callback=progress_callback, is_cancelled=is_cancelled)
+
+
+def read_backup_metadata(backup_path: str) -> Optional[Dict[str, Any]]:
+    """백업 파일의 metadata.json (없으면 None)"""
+    with zipfile.ZipFile(backup_path, 'r') as zipf:
+        if METADATA_NAME not in zipf.namelist():
+            return None
+        return json.loads(zipf.read(METADATA_NAME).decode('utf-8'))
+
+
+class BackupReader:
+    """새 형식과 이전 형식(backup.json + base64 이미지)을 모두 읽는 백업 리더"""
+
+    def __init__(self, backup_path: str, blob_store: Optional[BlobStore] = None):
+        self.backup_path = backup_path
+        self._zip = zipfile.ZipFile(backup_path, 'r')
+        names = set(self._zip.namelist())
+        self.is_legacy = LIBRARY_NAME not in names and LEGACY_NAME in names
+        # 증분 백업: 파일명 -> 블롭 해시
+        self.manifest: Optional[Dict[str, str]] = None
+        if MANIFEST_NAME in names:
+            self.manifest = json.loads(self._zip.read(MANIFEST_NAME).decode('utf-8'))
+        self.blob_store = blob_store or BlobStore(
+            os.path.join(os.path.dirname(os.path.abspath(backup_path)), BLOB_DIR_NAME))
+        if not self.is_legacy and LIBRARY_NAME not in names:
+            self._zip.close()
+            raise ValueError("백업 파일에 북 데이터가 없습니다.")
+        # 이전 형식은 backup.json 전체를 한 번에 읽을 수밖에 없음
+        self._legacy_data: Optional[Dict[str, Any]] = None
+
+    def close(self) -> None:
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _legacy(self) -> Dict[str, Any]:
+        if self._legacy_data is None:
+            self._legacy_data = json.loads(self._zip.read(LEGACY_NAME).decode('utf-8'))
+        return self._legacy_data
+
+    def load_books(self) -> Any:
+        """백업된 북 데이터 (형식 변환 전 원본)"""
+        if self.is_legacy:
+            return self._legacy().get("books", {})
+        return json.loads(self._zip.read(LIBRARY_NAME).decode('utf-8')).get("books", {})
+
+    def image_names(self) -> List[str]:
+        if self.is_legacy:
+            return list(self._legacy().get("images", {}))
+        if self.manifest is not None:
+            return list(self.manifest)
+        return [info.filename[len(IMAGE_PREFIX):] for info in self._zip.infolist()
+                if info.filename.startswith(IMAGE_PREFIX) and not info.is_dir()]
+
+    def open_image(self, name: str) -> BinaryIO:
+        """이미지 하나를 읽는 스트림 (새 형식은 압축 해제 스트림, 이전 형식은 base64 해독 결과)"""
+        if self.is_legacy:
+            return io.BytesIO(base64.b64decode(self._legacy()["images"][name]))
+        if self.manifest is not None:
+            return self.blob_store.open(self.manifest[name])
+        return self._zip.open(IMAGE_PREFIX + name, 'r')
+
+    def import_images(self, names: List[str], store: ContentAddressedImageStore,
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      is_cancelled: Optional[Callable[[], bool]] = None,
+                      bytes_callback: Optional[Callable[[int], None]] = None,
+                      mapping: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """지정한 이미지만 백업에서 읽어 저장소로 바로 가져오기 (임시 폴더 없음)
+
+        반환값은 파일 이름 -> 저장소 참조. 백업에 없는 이름은 건너뜁니다.
+        mapping을 넘기면 그 dict에 채우므로 취소되어도 이미 가져온 이미지를 알 수 있습니다.
+        """
+        available = set(self.image_names())
+        mapping = {} if mapping is None else mapping
+        total = len(names)
+        for i, name in enumerate(names, 1):
+            if is_cancelled and is_cancelled():
+                raise BackupCancelled()
+            if name in available:
+                try:
+                    with self.open_image(name) as src:
+                        mapping[name] = store.import_stream(
+                            _MeteredStream(src, bytes_callback, is_cancelled), os.path.splitext(name)[1])
+                except BackupCancelled:
+                    raise
+                except Exception as e:
+                    print(f"[ERROR] 이미지 복원 실패 {name}: {e}")
+            if progress_callback:
+                progress_callback(i, total)
+        return mapping
+
+    def extract_images(self, images_dir: str, names: Optional[List[str]] = None,
+                       progress_callback: Optional[Callable[[int, int], None]] = None,
+                       is_cancelled: Optional[Callable[[], bool]] = None,
+                       bytes_callback: Optional[Callable[[int], None]] = None) -> List[str]:
+        """이미지를 images_dir에 조각 단위로 복원하고 복원한 파일 경로 목록 반환"""
+        names = self.image_names() if names is None else names
+        restored: List[str] = []
+        total = len(names)
+        for i, name in enumerate(names, 1):
+            if is_cancelled and is_cancelled():
+                raise BackupCancelled()
+            # 멤버 이름에 경로가 섞여 있어도 images 폴더 밖으로 쓰지 않음
+            safe_name = os.path.basename(name.replace('\\', '/'))
+            if not safe_name:
+                continue
+            dest_path = os.path.join(images_dir, safe_name)
+            tmp_path = dest_path + ".restore"
+            try:
+                with self.open_image(name) as src, open(tmp_path, 'wb') as dst:
+                    _copy_stream(src, dst, bytes_callback, is_cancelled)
+                os.replace(tmp_path, dest_path)
+                restored.append(dest_path)
+            except BackupCancelled:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            except Exception as e:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                print(f"[ERROR] 이미지 복원 실패 {name}: {e}")
+            if progress_callback:
+                progress_callback(i, total)
+        return restored
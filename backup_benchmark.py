@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백업 압축 방식 벤치마크
+임시 폴더에 가상의 라이브러리(프롬프트가 담긴 북 데이터, PNG/JPEG 같은 압축된 이미지,
+BMP 같은 비압축 이미지)를 만들고 압축 설정별로 전체 백업을 만들어
+백업 시간, 파일 크기, 복원(읽기) 시간을 표로 출력합니다.
+
+    python backup_benchmark.py                 # 기본 크기
+    python backup_benchmark.py --images 400 --raw-ratio 0.5
+"""
+
+import os
+import sys
+import time
+import random
+import shutil
+import struct
+import zlib
+import tempfile
+import argparse
+
+from backup_archive import (
+    COMPRESSION_PROFILES, BlobStore, BackupReader, write_backup, write_incremental_backup, verify_backup,
+)
+
+PROMPT_WORDS = (
+    "masterpiece best_quality 1girl solo long_hair looking_at_viewer smile blue_eyes "
+    "outdoors sky cloud day tree flower dress standing upper_body sunlight detailed_background "
+    "cinematic_lighting depth_of_field portrait landscape night city rain reflection"
+).split()
+
+
+def _png_bytes(width: int, height: int, rng: random.Random) -> bytes:
+    """노이즈가 섞인 그라디언트 PNG (zlib으로 이미 압축된 내용)"""
+    rows = []
+    for y in range(height):
+        row = bytearray(b'\x00')
+        for x in range(width):
+            row += bytes(((x * 255 // width + rng.randrange(32)) & 0xFF,
+                          (y * 255 // height + rng.randrange(32)) & 0xFF,
+                          rng.randrange(256)))
+        rows.append(bytes(row))
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(b''.join(rows), 6)) + chunk(b'IEND', b''))
+
+
+def _bmp_bytes(width: int, height: int, rng: random.Random) -> bytes:
+    """24비트 BMP (압축되지 않은 그라디언트 + 약한 노이즈)"""
+    row_size = (width * 3 + 3) & ~3
+    pixels = bytearray()
+    for y in range(height):
+        row = bytearray()
+        for x in range(width):
+            row += bytes(((x * 255 // width) & 0xFF, (y * 255 // height) & 0xFF,
+                          (128 + rng.randrange(8)) & 0xFF))
+        row += b'\x00' * (row_size - len(row))
+        pixels += row
+    header = struct.pack("<2sIHHI", b'BM', 54 + len(pixels), 0, 0, 54)
+    info = struct.pack("<IiiHHIIiiII", 40, width, height, 1, 24, 0, len(pixels), 2835, 2835, 0, 0)
+    return header + info + bytes(pixels)
+
+
+def build_library(root: str, image_count: int, raw_ratio: float, size: int, books: int, seed: int = 1):
+    """가상 라이브러리 생성 → (북 데이터, images 폴더)"""
+    rng = random.Random(seed)
+    images_dir = os.path.join(root, "images")
+    os.makedirs(images_dir)
+    names = []
+    for i in range(image_count):
+        if rng.random() < raw_ratio:
+            name, data = f"{i:05d}.bmp", _bmp_bytes(size, size, rng)
+        else:
+            name, data = f"{i:05d}.png", _png_bytes(size, size, rng)
+        with open(os.path.join(images_dir, name), 'wb') as f:
+            f.write(data)
+        names.append(name)
+
+    library = {}
+    for b in range(books):
+        pages = []
+        for i, name in enumerate(names[b::books]):
+            prompt = ", ".join(rng.choice(PROMPT_WORDS) for _ in range(rng.randint(20, 60)))
+            pages.append({
+                "name": f"페이지 {i + 1}",
+                "tags": ", ".join(rng.sample(PROMPT_WORDS, 5)),
+                "desc": "",
+                "prompt": prompt,
+                "image_path": os.path.join("images", name),
+            })
+        library[f"북 {b + 1}"] = {"emoji": "📕", "pages": pages}
+    return library, images_dir
+
+
+def _dir_size(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _dirs, files in os.walk(path) for name in files)
+
+
+def run_benchmark(image_count: int, raw_ratio: float, size: int, books: int) -> None:
+    work = tempfile.mkdtemp(prefix="promptbook_bench_")
+    try:
+        library, images_dir = build_library(work, image_count, raw_ratio, size, books)
+        source_bytes = _dir_size(images_dir)
+        print(f"가상 라이브러리: 북 {books}개, 이미지 {image_count}개 "
+              f"(BMP {raw_ratio:.0%}, {size}x{size}), 원본 {source_bytes / (1024 * 1024):.1f}MB")
+        print(f"{'방식':<22}{'백업(초)':>10}{'크기(MB)':>11}{'비율':>8}{'읽기(초)':>10}{'검증(초)':>10}")
+
+        rows = [(f"전체 · {profile}", profile, False) for profile in COMPRESSION_PROFILES]
+        rows.append(("증분 · balanced (첫 번째)", "balanced", True))
+        rows.append(("증분 · balanced (변경 없음)", "balanced", True))
+        backup_dir = os.path.join(work, "backup")
+        os.makedirs(backup_dir)
+        blob_store = BlobStore(os.path.join(backup_dir, "blobs"))
+        for index, (label, profile, incremental) in enumerate(rows):
+            path = os.path.join(backup_dir, f"bench_{index}.pbk")
+            blobs_before = _dir_size(blob_store.root) if os.path.isdir(blob_store.root) else 0
+            started = time.perf_counter()
+            if incremental:
+                write_incremental_backup(path, library, images_dir, "bench", f"bench_{index}", blob_store,
+                                         compression=profile)
+            else:
+                write_backup(path, library, images_dir, "bench", f"bench_{index}", compression=profile)
+            backup_seconds = time.perf_counter() - started
+            blobs_after = _dir_size(blob_store.root) if os.path.isdir(blob_store.root) else 0
+            written = os.path.getsize(path) + (blobs_after - blobs_before)
+
+            started = time.perf_counter()
+            with BackupReader(path, blob_store) as reader:
+                reader.load_books()
+                for name in reader.image_names():
+                    with reader.open_image(name) as src:
+                        while src.read(1024 * 1024):
+                            pass
+            read_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            verify = verify_backup(path, blob_store)
+            verify_seconds = time.perf_counter() - started
+            if not verify["ok"]:
+                print(f"[ERROR] 검증 실패: {verify['failed']} ({verify['reason']})")
+
+            print(f"{label:<22}{backup_seconds:>10.2f}{written / (1024 * 1024):>11.2f}"
+                  f"{written / max(1, source_bytes):>8.0%}{read_seconds:>10.2f}{verify_seconds:>10.2f}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="백업 압축 방식별 시간/크기 벤치마크")
+    parser.add_argument("--images", type=int, default=120, help="이미지 수")
+    parser.add_argument("--raw-ratio", type=float, default=0.3, help="비압축(BMP) 이미지 비율 (0~1)")
+    parser.add_argument("--size", type=int, default=256, help="이미지 한 변 크기 (픽셀)")
+    parser.add_argument("--books", type=int, default=8, help="북 수")
+    args = parser.parse_args(argv)
+    run_benchmark(args.images, min(1.0, max(0.0, args.raw_ratio)), args.size, max(1, args.books))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+백업 카탈로그
+backup/ 폴더의 .pbk 파일별 메타데이터(생성 시각, 버전, 북/이미지 개수, 크기, 해시)를
+catalog.json에 보관해 복구 대화상자를 열 때 백업 파일을 하나하나 열지 않도록 합니다.
+크기나 수정시각이 바뀐 파일만 다시 읽습니다.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from typing import Callable, Dict, List, Optional, Any
+
+from backup_archive import read_backup_metadata
+from image_store import CHUNK_SIZE
+
+CATALOG_VERSION = 1
+CATALOG_NAME = "catalog.json"
+BACKUP_EXTENSION = ".pbk"
+
+
+def hash_backup_file(path: str, is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[str]:
+    """백업 파일 SHA-256 (도중에 취소되면 None)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            if is_cancelled and is_cancelled():
+                return None
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupCatalog:
+    """백업 파일 메타데이터 카탈로그 (스레드 안전)"""
+
+    def __init__(self, backup_dir: str):
+        self.backup_dir = backup_dir
+        self.catalog_file = os.path.join(backup_dir, CATALOG_NAME)
+        # 파일 이름 -> {"size", "mtime_ns", "metadata", "sha256", ...}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self.load()
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def refresh(self) -> List[Dict[str, Any]]:
+        """폴더와 카탈로그를 맞추고 백업 목록 반환 (최신순)
+
+        크기/수정시각이 같은 파일은 카탈로그 내용을 그대로 쓰고, 바뀐 파일만 다시 엽니다.
+        """
+        found = {}
+        if os.path.isdir(self.backup_dir):
+            with os.scandir(self.backup_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(BACKUP_EXTENSION):
+                        st = entry.stat()
+                        found[entry.name] = (st.st_size, st.st_mtime_ns)
+
+        changed = False
+        with self._lock:
+            for name in [name for name in self.entries if name not in found]:
+                del self.entries[name]
+                changed = True
+            for name, (size, mtime_ns) in found.items():
+                cached = self.entries.get(name)
+                if cached and cached.get("size") == size and cached.get("mtime_ns") == mtime_ns:
+                    continue
+                path = os.path.join(self.backup_dir, name)
+                try:
+                    metadata = read_backup_metadata(path)
+                except Exception as e:
+                    print(f"[ERROR] 백업 파일 메타데이터 읽기 실패 {name}: {e}")
+                    metadata = None
+                # 읽을 수 없는 파일도 다시 열지 않도록 기록 (metadata=None)
+                self.entries[name] = {"size": size, "mtime_ns": mtime_ns, "metadata": metadata}
+                changed = True
+            if changed:
+                self.save()
+            return self.list()
+
+    def record(self, path: str, metadata: Dict[str, Any], sha256: Optional[str] = None,
+               **extra: Any) -> None:
+        """새로 만든 백업 등록"""
+        st = os.stat(path)
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "metadata": metadata}
+        if sha256:
+            entry["sha256"] = sha256
+        entry.update(extra)
+        with self._lock:
+            self.entries[os.path.basename(path)] = entry
+            self.save()
+
+    def update(self, path: str, **fields: Any) -> None:
+        """기존 항목에 필드 추가/변경 (검증 결과 등)"""
+        with self._lock:
+            entry = self.entries.get(os.path.basename(path))
+            if entry is None:
+                return
+            entry.update(fields)
+            self.save()
+
+    def remove(self, path: str) -> None:
+        with self._lock:
+            if self.entries.pop(os.path.basename(path), None) is not None:
+                self.save()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(os.path.basename(path))
+
+    def list(self) -> List[Dict[str, Any]]:
+        """메타데이터를 읽을 수 있는 백업 목록 (최신순)"""
+        with self._lock:
+            items = [
+                dict(entry, filename=name, path=os.path.join(self.backup_dir, name))
+                for name, entry in self.entries.items() if entry.get("metadata")
+            ]
+        items.sort(key=lambda item: str(item["metadata"].get("created", "")), reverse=True)
+        return items
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        if not os.path.exists(self.catalog_file):
+            return
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CATALOG_VERSION:
+                return
+            with self._lock:
+                self.entries = dict(data.get("entries", {}))
+        except Exception as e:
+            print(f"[ERROR] 백업 카탈로그 로드 실패: {e}")
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {"version": CATALOG_VERSION, "entries": dict(self.entries)}
+            try:
+                os.makedirs(self.backup_dir, exist_ok=True)
+                tmp_path = self.catalog_file + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self.catalog_file)
+            except Exception as e:
+                print(f"[ERROR] 백업 카탈로그 저장 실패: {e}")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+선택한 북 내보내기 (zip)
+여러 북이 같은 이미지를 써도 내용 해시가 같으면 zip에는 한 번만 담습니다
+(images/<sha256><확장자>). 해시 계산과 작은 파일 읽기는 스레드 풀에서 하고,
+zip 기록은 호출한 스레드 하나가 제출 순서대로 처리합니다.
+PNG/JPEG/WebP처럼 이미 압축된 형식은 STORED로 저장하고, 나머지는 백업과 같은
+압축 설정(choose_compression)을 따릅니다.
+마지막 멤버인 integrity.json에 멤버별 SHA-256을 기록합니다.
+
+형식은 불러오기(load_saved_book)와 같습니다:
+    북 1개   book_data.json  {"book_name", "emoji", "pages"}
+    북 여러 개 books_data.json {"format": "multiple_books", "books": [...]}
+"""
+
+import os
+import json
+import hashlib
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backup_archive import BackupCancelled, IMAGE_PREFIX, DEFAULT_COMPRESSION, apply_compression, _write_json, _copy_stream
+from archive_integrity import HashingWriter, IntegrityManifest
+from image_store import ContentAddressedImageStore, hash_file, normalize_extension
+
+# 이 크기 이하의 파일은 작업 스레드가 읽어서 넘기고, 큰 파일은 기록할 때 조각 단위로 복사
+SMALL_FILE_BYTES = 4 * 1024 * 1024
+EXPORT_WORKERS = max(2, min(8, (os.cpu_count() or 2)))
+
+
+def _prepare_image(path: str) -> Tuple[str, Optional[bytes], Optional[str]]:
+    """작업 스레드: (중복 판단용 해시, 작은 파일이면 내용, 작은 파일이면 실제 내용 해시)
+
+    저장소 이미지는 파일 이름의 해시로 중복을 판단하고, 무결성 목록에는 읽은 내용의 해시를 씁니다.
+    """
+    digest = ContentAddressedImageStore.digest_from_path(path)
+    if os.path.getsize(path) <= SMALL_FILE_BYTES:
+        with open(path, 'rb') as f:
+            data = f.read()
+        content_digest = hashlib.sha256(data).hexdigest()
+        return digest or content_digest, data, content_digest
+    return digest or hash_file(path), None, None
+
+
+def write_book_export(export_path: str, books: List[Tuple[str, Dict[str, Any]]],
+                      resolve: Callable[[str], str],
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      is_cancelled: Optional[Callable[[], bool]] = None,
+                      bytes_callback: Optional[Callable[[int], None]] = None,
+                      workers: int = EXPORT_WORKERS,
+                      compression: str = DEFAULT_COMPRESSION) -> Dict[str, int]:
+    """북 목록을 zip으로 내보내기 → {"images", "unique_images", "bytes"}
+
+    books는 (북 이름, 북 데이터) 목록이고 resolve는 페이지 이미지 참조를 실제 경로로 바꿉니다
+    (없는 파일이면 빈 문자열). 취소되거나 실패하면 만들던 파일을 지웁니다.
+    """
+    # 페이지가 참조하는 이미지 경로 (같은 경로는 한 번만 처리)
+    page_paths = [[resolve(page.get("image_path") or "") for page in book_data.get("pages", [])]
+                  for _book_name, book_data in books]
+    unique_paths = list(dict.fromkeys(path for paths in page_paths for path in paths if path))
+    total = len(unique_paths)
+
+    member_for_path: Dict[str, str] = {}
+    written: Dict[str, str] = {}  # 내용 해시 -> zip 멤버 이름
+    written_bytes = 0
+    part_path = export_path + ".part"
+    integrity = IntegrityManifest()
+    try:
+        with zipfile.ZipFile(part_path, 'w', zipfile.ZIP_DEFLATED) as zipf, \
+                ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            pending = deque()
+            paths = iter(unique_paths)
+            done = 0
+
+            def submit_next() -> None:
+                path = next(paths, None)
+                if path is not None:
+                    pending.append((path, executor.submit(_prepare_image, path)))
+
+            # 메모리에 올라가는 작은 파일 수를 제한 (작업 스레드 수의 2배까지만 미리 읽음)
+            for _ in range(max(1, workers) * 2):
+                submit_next()
+            while pending:
+                if is_cancelled and is_cancelled():
+                    for _path, future in pending:
+                        future.cancel()
+                    raise BackupCancelled()
+                path, future = pending.popleft()
+                submit_next()
+                try:
+                    digest, data, content_digest = future.result()
+                except OSError as e:
+                    print(f"[ERROR] 이미지 내보내기 실패 {os.path.basename(path)}: {e}")
+                    digest, data, content_digest = None, None, None
+                if digest is not None and digest not in written:
+                    member_name = f"{IMAGE_PREFIX}{digest}{normalize_extension(path)}"
+                    try:
+                        # 해시 계산 뒤에 지워진 파일은 zip 멤버를 만들기 전에 건너뜀
+                        info = zipfile.ZipInfo.from_file(path, member_name)
+                        src = open(path, 'rb') if data is None else None
+                    except OSError as e:
+                        print(f"[ERROR] 이미지 내보내기 실패 {os.path.basename(path)}: {e}")
+                        digest = None
+                    else:
+                        apply_compression(info, info.file_size, compression)
+                        if src is None:
+                            zipf.writestr(info, data)
+                            integrity.add_digest(member_name, content_digest)
+                            written_bytes += len(data)
+                            if bytes_callback:
+                                bytes_callback(len(data))
+                        else:
+                            with src, zipf.open(info, 'w', force_zip64=True) as dst:
+                                hashing = HashingWriter(dst)
+                                written_bytes += _copy_stream(src, hashing, bytes_callback, is_cancelled)
+                            integrity.add_digest(member_name, hashing.hexdigest())
+                        written[digest] = member_name
+                if digest is not None:
+                    member_for_path[path] = written[digest]
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+
+            # 페이지 참조를 zip 멤버 이름으로 바꾼 북 데이터
+            exported = []
+            for (book_name, book_data), paths in zip(books, page_paths):
+                pages = []
+                for page, path in zip(book_data.get("pages", []), paths):
+                    page_copy = dict(page)
+                    page_copy["image_path"] = member_for_path.get(path, "")
+                    pages.append(page_copy)
+                exported.append({"book_name": book_name, "emoji": book_data.get("emoji", "📕"), "pages": pages})
+            if len(exported) == 1:
+                _write_json(zipf, integrity, "book_data.json",
+                            json.dumps(exported[0], ensure_ascii=False, indent=2), compression)
+            else:
+                _write_json(zipf, integrity, "books_data.json", json.dumps(
+                    {"format": "multiple_books", "books": exported}, ensure_ascii=False, indent=2), compression)
+            integrity.write(zipf)
+        os.replace(part_path, export_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    return {"images": len(member_for_path), "unique_images": len(written), "bytes": written_bytes}
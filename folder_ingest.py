@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+폴더 가져오기
+폴더(하위 폴더 포함)의 생성 이미지에서 내장 프롬프트를 읽어 같은 프롬프트끼리
+묶고, 묶음마다 페이지 하나를 만드는 계획을 세웁니다.
+계획 단계는 파일을 복사하거나 데이터를 바꾸지 않으므로 미리보기(dry-run)로 쓸 수 있습니다.
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Any, Callable, Iterable
+
+from image_store import IMAGE_EXTENSIONS
+from metadata_cache import extract_many
+
+# A1111 parameters의 생성 설정 줄 (시드 등 이미지마다 달라지는 값)
+_GENERATION_PARAMS_RE = re.compile(r'^\s*Steps:\s', re.MULTILINE)
+_NEGATIVE_PROMPT_RE = re.compile(r'^\s*Negative prompt:', re.MULTILINE)
+PAGE_NAME_MAX_LENGTH = 40
+
+
+def scan_image_files(root_dir: str) -> List[str]:
+    """폴더 트리의 이미지 파일 목록 (경로 순 정렬)"""
+    found: List[str] = []
+    for root, dirs, files in os.walk(root_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.startswith('.'):
+                continue
+            if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                found.append(os.path.join(root, name))
+    return found
+
+
+def prompt_group_key(info: Optional[Dict[str, Any]]) -> str:
+    """같은 프롬프트로 묶기 위한 키 (생성 설정 줄 제외, 공백 정규화). 프롬프트가 없으면 빈 문자열"""
+    if not info:
+        return ""
+    text = info.get("parsed_prompt") or info.get("raw_prompt") or ""
+    match = _GENERATION_PARAMS_RE.search(text)
+    if match:
+        text = text[:match.start()]
+    return "\n".join(" ".join(line.split()) for line in text.strip().splitlines() if line.strip())
+
+
+def page_prompt_text(group_key: str) -> str:
+    """페이지 프롬프트 입력란에 넣을 텍스트 (A1111 형식이면 네거티브 앞까지)"""
+    match = _NEGATIVE_PROMPT_RE.search(group_key)
+    return group_key[:match.start()].strip() if match else group_key
+
+
+def page_name_from_prompt(prompt: str, index: int) -> str:
+    """프롬프트 앞부분 태그로 페이지 이름 만들기"""
+    first_line = ""
+    for line in prompt.splitlines():
+        # NovelAI 파싱 결과의 머리글(📝 메인 프롬프트:) 줄은 건너뜀
+        if line.strip() and not line.rstrip().endswith(':'):
+            first_line = line
+            break
+    tags = [tag.strip() for tag in first_line.split(',') if tag.strip()]
+    name = ", ".join(tags[:3])
+    if len(name) > PAGE_NAME_MAX_LENGTH:
+        name = name[:PAGE_NAME_MAX_LENGTH].rstrip() + "…"
+    return name or f"가져온 페이지 {index}"
+
+
+class IngestGroup:
+    """같은 프롬프트를 가진 이미지 묶음 (페이지 하나가 됨)"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.paths: List[str] = []
+        self.name = ""
+
+    @property
+    def prompt(self) -> str:
+        return page_prompt_text(self.key)
+
+
+class IngestPlan:
+    """폴더 가져오기 계획 (미리보기 및 실제 생성에 사용)"""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self.groups: List[IngestGroup] = []
+        # 프롬프트를 찾지 못해 제외된 이미지
+        self.skipped: List[str] = []
+        self.failed = 0
+        self.scanned = 0
+        self.cancelled = False
+
+    @property
+    def image_paths(self) -> List[str]:
+        return [path for group in self.groups for path in group.paths]
+
+    def assign_names(self, existing_names: Iterable[str]) -> None:
+        """북의 기존 페이지 이름과 겹치지 않게 페이지 이름 지정"""
+        used = set(existing_names)
+        for i, group in enumerate(self.groups, 1):
+            base = page_name_from_prompt(group.prompt, i)
+            name = base
+            suffix = 1
+            while name in used:
+                name = f"{base} ({suffix})"
+                suffix += 1
+            used.add(name)
+            group.name = name
+
+    def summary_lines(self, limit: int = 50) -> List[str]:
+        lines = [f"{group.name}  —  이미지 {len(group.paths)}개" for group in self.groups[:limit]]
+        if len(self.groups) > limit:
+            lines.append(f"... 외 {len(self.groups) - limit}개 페이지")
+        return lines
+
+    def build_pages(self, ref_map: Dict[str, str]) -> List[Dict[str, Any]]:
+        """가져온 이미지 참조(원본 경로 -> 저장소 참조)로 페이지 데이터 생성"""
+        pages: List[Dict[str, Any]] = []
+        for group in self.groups:
+            refs = list(dict.fromkeys(ref_map[path] for path in group.paths if ref_map.get(path)))
+            if not refs:
+                continue
+            pages.append({
+                "name": group.name,
+                "tags": "",
+                "desc": "",
+                "prompt": group.prompt,
+                "emoji": "📄",
+                "image_path": refs[0],
+                "additional_images": refs[1:],
+            })
+        return pages
+
+
+def plan_folder_ingest(root_dir: str, metadata_cache=None, workers: Optional[int] = None,
+                       progress_callback: Optional[Callable[[int, int], None]] = None,
+                       is_cancelled: Optional[Callable[[], bool]] = None) -> IngestPlan:
+    """폴더를 스캔하고 프롬프트별로 묶은 계획 반환 (작업 스레드에서 호출, 데이터 변경 없음)"""
+    plan = IngestPlan(root_dir)
+    paths = scan_image_files(root_dir)
+    plan.scanned = len(paths)
+    keys: Dict[str, str] = {}
+
+    def on_result(path: str, info: Optional[Dict[str, Any]]) -> None:
+        keys[path] = prompt_group_key(info)
+
+    result = extract_many(paths, cache=metadata_cache, workers=workers,
+                          progress_callback=progress_callback,
+                          is_cancelled=is_cancelled, on_result=on_result)
+    plan.failed = result["failed"]
+    plan.cancelled = result["cancelled"]
+    if plan.cancelled:
+        return plan
+
+    # 폴더 순서를 유지하며 묶음 생성 (처음 등장한 순서)
+    groups: Dict[str, IngestGroup] = {}
+    for path in paths:
+        key = keys.get(path)
+        if key is None:
+            continue
+        if not key:
+            plan.skipped.append(path)
+            continue
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = IngestGroup(key)
+        group.paths.append(path)
+    plan.groups = list(groups.values())
+    return plan
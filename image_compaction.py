@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+무손실 이미지 압축 정리
+images/ 폴더의 PNG를 Pillow로 다시 인코딩(최적화 PNG 또는 무손실 WebP)해 용량을 줄입니다.
+
+- 픽셀 데이터만 다시 압축하고, 원본의 텍스트 청크(tEXt/iTXt/zTXt)와 eXIf, 색 관련
+  청크는 바이트 그대로 옮겨 붙이므로 내장 프롬프트가 그대로 유지됩니다.
+- 새 파일을 다시 열어 픽셀과 메타데이터가 원본과 같은지 확인한 경우에만 교체합니다.
+- 저장소 이미지는 새 해시 이름으로 등록하고 참조를 바꾼 뒤(호출자가 저장 후) 이전
+  파일을 지우며, 그 밖의 파일은 같은 이름으로 원자적으로 교체합니다.
+- 처리한 파일은 상태 파일에 기록되어 중단 후 다시 실행하면 남은 파일만 처리합니다.
+- 동시 작업 수와 초당 처리량(MB/s) 제한으로 속도를 조절할 수 있습니다.
+"""
+
+import os
+import io
+import json
+import time
+import zlib
+import struct
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+from image_store import ContentAddressedImageStore
+from image_metadata import PNG_SIGNATURE, read_image_metadata
+
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+STATE_VERSION = 1
+# 원본에서 그대로 옮겨 붙일 보조 청크 (IHDR 바로 뒤에 삽입 - 모두 PLTE/IDAT 앞에 와도 되는 청크)
+PRESERVED_CHUNKS = (b'tEXt', b'iTXt', b'zTXt', b'eXIf', b'iCCP', b'sRGB', b'gAMA', b'cHRM', b'pHYs', b'tIME')
+# 이보다 적게 줄어들면 교체하지 않음 (원본 대비 비율)
+MIN_SAVING_RATIO = 0.02
+COMPACT_FORMATS = ("png", "webp")
+
+
+def read_png_chunks(data: bytes) -> List[Tuple[bytes, bytes]]:
+    """PNG 바이트를 (청크 타입, 청크 데이터) 목록으로 분해"""
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("PNG 파일이 아닙니다")
+    chunks = []
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack('>I4s', data[pos:pos + 8])
+        chunks.append((chunk_type, data[pos + 8:pos + 8 + length]))
+        pos += 12 + length
+        if chunk_type == b'IEND':
+            break
+    return chunks
+
+
+def write_png_chunks(chunks: List[Tuple[bytes, bytes]]) -> bytes:
+    out = io.BytesIO()
+    out.write(PNG_SIGNATURE)
+    for chunk_type, body in chunks:
+        out.write(struct.pack('>I', len(body)))
+        out.write(chunk_type)
+        out.write(body)
+        out.write(struct.pack('>I', zlib.crc32(chunk_type + body) & 0xffffffff))
+    return out.getvalue()
+
+
+def splice_metadata(original: bytes, encoded: bytes) -> bytes:
+    """새로 인코딩한 PNG에서 메타데이터 청크를 빼고 원본의 메타데이터 청크를 그대로 넣기"""
+    preserved = [chunk for chunk in read_png_chunks(original) if chunk[0] in PRESERVED_CHUNKS]
+    result = []
+    for chunk in read_png_chunks(encoded):
+        if chunk[0] in PRESERVED_CHUNKS:
+            continue
+        result.append(chunk)
+        if chunk[0] == b'IHDR':
+            result.extend(preserved)
+    return write_png_chunks(result)
+
+
+def png_bit_depth(data: bytes) -> Optional[int]:
+    """IHDR의 채널당 비트 수 (읽을 수 없으면 None)"""
+    for chunk_type, body in read_png_chunks(data):
+        if chunk_type == b'IHDR':
+            return body[8] if len(body) >= 13 else None
+    return None
+
+
+def _has_text_metadata(data: bytes) -> bool:
+    return any(chunk[0] in (b'tEXt', b'iTXt', b'zTXt', b'eXIf') for chunk in read_png_chunks(data))
+
+
+def _same_pixels(a: "Image.Image", b: "Image.Image") -> bool:
+    if a.size != b.size:
+        return False
+    if a.mode == b.mode and a.mode != "P":
+        return a.tobytes() == b.tobytes()
+    # 팔레트 이미지나 형식이 바뀐 경우(WebP) RGBA로 펼쳐 비교
+    return a.convert("RGBA").tobytes() == b.convert("RGBA").tobytes()
+
+
+def compact_image(path: str, tmp_dir: str, target: str = "png") -> Dict[str, Any]:
+    """이미지 하나를 다시 인코딩하고 검증 (프로세스 풀 작업 함수)
+
+    교체할 가치가 있으면 검증을 마친 임시 파일 경로를 "tmp_path"로 반환합니다.
+    원본 파일은 건드리지 않습니다.
+    """
+    result: Dict[str, Any] = {"path": path, "tmp_path": None, "old_size": 0, "new_size": 0,
+                              "ext": ".png", "status": "skipped", "error": None}
+    tmp_path = None
+    try:
+        with open(path, 'rb') as f:
+            original = f.read()
+        result["old_size"] = len(original)
+        if not original.startswith(PNG_SIGNATURE):
+            return result
+        # 16비트 PNG는 Pillow가 8비트로 읽어 다시 저장하므로 비교가 통과해도 손실이 생김
+        bit_depth = png_bit_depth(original)
+        if bit_depth is None or bit_depth > 8:
+            return result
+
+        with Image.open(io.BytesIO(original)) as source:
+            source.load()
+            # WebP에는 PNG 텍스트 청크를 담을 수 없으므로 프롬프트가 있는 이미지는 PNG로 유지
+            use_webp = (target == "webp" and source.mode in ("RGB", "RGBA", "L", "LA", "P")
+                        and not _has_text_metadata(original))
+            buffer = io.BytesIO()
+            if use_webp:
+                icc = source.info.get("icc_profile")
+                save_args = {"lossless": True, "quality": 100, "method": 6}
+                if icc:
+                    save_args["icc_profile"] = icc
+                source.save(buffer, "WEBP", **save_args)
+                encoded = buffer.getvalue()
+                result["ext"] = ".webp"
+            else:
+                source.save(buffer, "PNG", optimize=True)
+                encoded = splice_metadata(original, buffer.getvalue())
+
+            if len(encoded) > len(original) * (1 - MIN_SAVING_RATIO):
+                return result
+
+            # 다시 열어 픽셀 비교
+            with Image.open(io.BytesIO(encoded)) as check:
+                check.load()
+                if not _same_pixels(source, check):
+                    result["status"] = "mismatch"
+                    return result
+
+        fd, tmp_path = tempfile.mkstemp(prefix=".compact_", suffix=result["ext"], dir=tmp_dir)
+        with os.fdopen(fd, 'wb') as out:
+            out.write(encoded)
+        if not use_webp:
+            # 프롬프트 리더가 보는 텍스트/EXIF가 그대로인지 확인
+            before = read_image_metadata(path)
+            after = read_image_metadata(tmp_path)
+            if before.text != after.text or before.exif != after.exif:
+                os.remove(tmp_path)
+                result["status"] = "mismatch"
+                return result
+
+        result["tmp_path"] = tmp_path
+        result["new_size"] = len(encoded)
+        result["status"] = "compacted"
+        return result
+    except Exception as e:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        result["status"] = "failed"
+        result["error"] = str(e)
+        return result
+
+
+class CompactionState:
+    """처리 완료된 파일 기록 (다시 실행할 때 건너뛰기용)"""
+
+    def __init__(self, state_file: str):
+        self.state_file = state_file
+        # 파일 이름 -> 처리 당시 크기
+        self.done: Dict[str, int] = {}
+        self.bytes_saved_total = 0
+        self.load()
+
+    def is_done(self, path: str, size: int) -> bool:
+        return self.done.get(os.path.basename(path)) == size
+
+    def mark(self, path: str, size: int) -> None:
+        self.done[os.path.basename(path)] = size
+
+    def load(self) -> None:
+        if not os.path.exists(self.state_file):
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != STATE_VERSION:
+                return
+            self.done = dict(data.get("done", {}))
+            self.bytes_saved_total = int(data.get("bytes_saved_total", 0))
+        except Exception as e:
+            print(f"[ERROR] 이미지 압축 상태 로드 실패: {e}")
+
+    def save(self) -> None:
+        payload = {"version": STATE_VERSION, "done": self.done, "bytes_saved_total": self.bytes_saved_total}
+        try:
+            tmp_path = self.state_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            print(f"[ERROR] 이미지 압축 상태 저장 실패: {e}")
+
+
+def collect_candidates(images_dir: str, state: CompactionState) -> List[str]:
+    """아직 처리하지 않은 PNG 목록 (큰 파일부터)"""
+    candidates = []
+    if not os.path.isdir(images_dir):
+        return candidates
+    with os.scandir(images_dir) as entries:
+        for entry in entries:
+            if not entry.is_file() or entry.name.startswith('.'):
+                continue
+            if os.path.splitext(entry.name)[1].lower() != '.png':
+                continue
+            size = entry.stat().st_size
+            if not state.is_done(entry.path, size):
+                candidates.append((size, entry.path))
+    candidates.sort(reverse=True)
+    return [path for _, path in candidates]
+
+
+class ImageCompactor:
+    """images/ 폴더 무손실 압축 작업 (작업 스레드에서 run 호출)
+
+    결과의 "mapping"(이전 절대 경로 -> 새 참조)은 호출자가 페이지 참조에 반영하고
+    저장한 뒤 "obsolete_files"를 삭제하고 commit()을 호출해야 합니다.
+    """
+
+    def __init__(self, store: ContentAddressedImageStore, state_file: str, target: str = "png",
+                 workers: Optional[int] = None, max_mb_per_second: float = 0.0):
+        if target not in COMPACT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식: {target}")
+        self.store = store
+        self.state = CompactionState(state_file)
+        self.target = target
+        self.workers = workers or max(1, min(2, (os.cpu_count() or 2) - 1))
+        # 0이면 제한 없음. 원본 기준 읽기 처리량을 이 값 이하로 유지
+        self.max_mb_per_second = max_mb_per_second
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def _throttle(self, started: float, bytes_read: int) -> None:
+        if self.max_mb_per_second <= 0:
+            return
+        expected = bytes_read / (self.max_mb_per_second * 1024 * 1024)
+        delay = expected - (time.monotonic() - started)
+        if delay > 0:
+            # 취소 요청에 바로 반응하도록 Event로 대기
+            self._cancelled.wait(delay)
+
+    def run(self, progress_callback: Optional[Callable[[int, int, int], None]] = None) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"total": 0, "compacted": 0, "skipped": 0, "mismatched": 0,
+                                  "failed": 0, "bytes_saved": 0, "cancelled": False,
+                                  "mapping": {}, "obsolete_files": []}
+        if not PIL_AVAILABLE:
+            result["error"] = "Pillow(PIL)가 설치되어 있지 않습니다."
+            return result
+
+        candidates = collect_candidates(self.store.images_dir, self.state)
+        total = result["total"] = len(candidates)
+        done = 0
+        bytes_read = 0
+        started = time.monotonic()
+        pending = iter(candidates)
+        in_flight = set()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            def submit_next() -> bool:
+                path = next(pending, None)
+                if path is None:
+                    return False
+                # 해시 이름이 아닌 파일은 이름(확장자)을 유지해야 하므로 항상 PNG
+                target = self.target if self.store.is_content_addressed(path) else "png"
+                in_flight.add(executor.submit(compact_image, path, self.store.images_dir, target))
+                return True
+
+            # 한 번에 작업 수만큼만 제출 (메모리 사용량과 디스크 부하 제한)
+            for _ in range(self.workers):
+                if not submit_next():
+                    break
+
+            while in_flight:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    in_flight.discard(future)
+                    item = future.result()
+                    self._apply(item, result)
+                    done += 1
+                    bytes_read += item["old_size"]
+                    if progress_callback:
+                        progress_callback(done, total, result["bytes_saved"])
+                if self._cancelled.is_set():
+                    result["cancelled"] = True
+                    continue
+                self._throttle(started, bytes_read)
+                while len(in_flight) < self.workers and not self._cancelled.is_set():
+                    if not submit_next():
+                        break
+        return result
+
+    def _apply(self, item: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """검증된 임시 파일을 저장소에 반영"""
+        path = item["path"]
+        status = item["status"]
+        if status == "failed":
+            result["failed"] += 1
+            print(f"[ERROR] 이미지 압축 실패 {os.path.basename(path)}: {item['error']}")
+            return
+        if status != "compacted":
+            result["mismatched" if status == "mismatch" else "skipped"] += 1
+            # 더 줄일 수 없거나 검증에 실패한 파일은 다음 실행에서 건너뜀
+            self.state.mark(path, item["old_size"])
+            return
+
+        tmp_path = item["tmp_path"]
+        try:
+            if self.store.is_content_addressed(path):
+                # 내용이 바뀌므로 새 해시 이름으로 등록하고 참조 갱신은 호출자에게 맡김
+                new_ref = self.store.adopt_file(tmp_path, item["ext"])
+                result["mapping"][os.path.normcase(os.path.abspath(path))] = new_ref
+                result["obsolete_files"].append(path)
+                self.state.mark(self.store.resolve(new_ref), item["new_size"])
+            else:
+                # 해시 이름이 아닌 파일은 같은 이름으로 원자적 교체 (참조 변경 없음)
+                os.replace(tmp_path, path)
+                self.state.mark(path, item["new_size"])
+        except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            result["failed"] += 1
+            print(f"[ERROR] 압축 이미지 교체 실패 {os.path.basename(path)}: {e}")
+            return
+        saved = item["old_size"] - item["new_size"]
+        result["compacted"] += 1
+        result["bytes_saved"] += saved
+        self.state.bytes_saved_total += saved
+
+    def commit(self) -> None:
+        """참조 갱신과 저장이 끝난 뒤 처리 기록 저장"""
+        self.state.save()
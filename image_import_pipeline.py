@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+대량 이미지 가져오기 파이프라인
+검증 → 해시 → 저장소 복사/링크 → 썸네일 → 메타데이터 추출 단계를
+제한된 크기의 큐로 연결해 스레드 풀에서 병렬 처리합니다.
+페이지 데이터 반영과 저장은 호출자가 결과를 받아 한 번만 수행합니다.
+"""
+
+import os
+import queue
+import threading
+from typing import List, Optional, Callable, Any, Dict
+
+from image_store import ContentAddressedImageStore, hash_file, IMAGE_EXTENSIONS
+
+_SENTINEL = object()
+
+
+class ImportItem:
+    """가져오기 대상 파일 하나의 처리 상태"""
+
+    def __init__(self, index: int, src_path: str):
+        self.index = index
+        self.src_path = src_path
+        self.digest: Optional[str] = None
+        self.ref: str = ""
+        self.created = False
+        self.thumbnail = None
+        self.metadata: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.ref)
+
+
+class ImportResult:
+    """파이프라인 실행 결과 (입력 순서 유지)"""
+
+    def __init__(self, items: List[ImportItem], cancelled: bool):
+        self.items = items
+        self.cancelled = cancelled
+
+    @property
+    def imported(self) -> List[ImportItem]:
+        return [item for item in self.items if item.ok]
+
+    @property
+    def failed(self) -> List[ImportItem]:
+        return [item for item in self.items if item.error]
+
+
+class _Stage:
+    """입력 큐에서 항목을 꺼내 처리하고 다음 큐로 넘기는 작업자 묶음"""
+
+    def __init__(self, name: str, func: Callable[[ImportItem], None], workers: int,
+                 in_queue: "queue.Queue", out_queue: "queue.Queue", downstream_workers: int,
+                 pipeline: "ImageImportPipeline"):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.in_queue = in_queue
+        self.out_queue = out_queue
+        self.downstream_workers = downstream_workers
+        self.pipeline = pipeline
+        self._remaining = workers
+        self._lock = threading.Lock()
+        self.threads = [threading.Thread(target=self._run, name=f"import-{name}-{i}", daemon=True)
+                        for i in range(workers)]
+
+    def start(self) -> None:
+        for thread in self.threads:
+            thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self.in_queue.get()
+            if item is _SENTINEL:
+                break
+            if item.error is None and not self.pipeline.is_cancelled():
+                try:
+                    self.func(item)
+                except Exception as e:
+                    item.error = f"{self.name}: {e}"
+            self.out_queue.put(item)
+        # 이 단계의 마지막 작업자가 끝나면 다음 단계 작업자 수만큼 종료 신호 전달
+        with self._lock:
+            self._remaining -= 1
+            last = self._remaining == 0
+        if last:
+            for _ in range(self.downstream_workers):
+                self.out_queue.put(_SENTINEL)
+
+
+class ImageImportPipeline:
+    """병렬 이미지 가져오기 파이프라인"""
+
+    def __init__(self, store: ContentAddressedImageStore, page_cache=None,
+                 metadata_extractor: Optional[Callable[[str], Optional[Dict[str, Any]]]] = None,
+                 workers: Optional[int] = None, queue_size: int = 16):
+        self.store = store
+        self.page_cache = page_cache
+        self.metadata_extractor = metadata_extractor
+        cpu_count = os.cpu_count() or 2
+        self.workers = workers or max(2, min(8, cpu_count))
+        self.queue_size = queue_size
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    # ------------------------------------------------------------------
+    # 단계별 처리
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _validate(item: ImportItem) -> None:
+        if not item.src_path or not os.path.isfile(item.src_path):
+            raise FileNotFoundError("파일이 존재하지 않습니다")
+        if os.path.splitext(item.src_path)[1].lower() not in IMAGE_EXTENSIONS:
+            raise ValueError("지원하지 않는 이미지 형식입니다")
+
+    @staticmethod
+    def _hash(item: ImportItem) -> None:
+        item.digest = hash_file(item.src_path)
+
+    def _store(self, item: ImportItem) -> None:
+        item.ref, item.created = self.store.import_file_with_status(item.src_path, item.digest)
+        if not item.ref:
+            raise IOError("저장소로 복사하지 못했습니다")
+
+    def _thumbnail(self, item: ImportItem) -> None:
+        if self.page_cache is not None:
+            # 메모리/디스크 썸네일 캐시를 미리 채워 썸네일바 표시를 빠르게 함
+            item.thumbnail = self.page_cache.get_thumbnail(self.store.resolve(item.ref))
+
+    def _metadata(self, item: ImportItem) -> None:
+        if self.metadata_extractor is not None:
+            item.metadata = self.metadata_extractor(self.store.resolve(item.ref))
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run(self, paths: List[str],
+            progress_callback: Optional[Callable[[int, int], None]] = None) -> ImportResult:
+        """파일 목록을 가져오고 결과 반환 (작업 스레드에서 호출)
+
+        취소되면 이번 실행에서 새로 저장한 파일을 지우고 cancelled=True를 반환합니다.
+        """
+        items = [ImportItem(i, path) for i, path in enumerate(dict.fromkeys(paths))]
+        total = len(items)
+        if not items:
+            return ImportResult(items, False)
+
+        stage_specs = [
+            ("validate", self._validate, 1),
+            ("hash", self._hash, self.workers),
+            ("store", self._store, max(1, self.workers // 2)),
+            ("thumbnail", self._thumbnail, self.workers),
+            ("metadata", self._metadata, max(1, self.workers // 2)),
+        ]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(stage_specs) + 1)]
+        stages = []
+        for i, (name, func, workers) in enumerate(stage_specs):
+            downstream = stage_specs[i + 1][2] if i + 1 < len(stage_specs) else 1
+            stages.append(_Stage(name, func, workers, queues[i], queues[i + 1], downstream, self))
+        for stage in stages:
+            stage.start()
+
+        def feed():
+            for item in items:
+                if self.is_cancelled():
+                    break
+                queues[0].put(item)
+            queues[0].put(_SENTINEL)
+
+        feeder = threading.Thread(target=feed, name="import-feed", daemon=True)
+        feeder.start()
+
+        done = 0
+        while True:
+            item = queues[-1].get()
+            if item is _SENTINEL:
+                break
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+        feeder.join()
+        cancelled = self.is_cancelled()
+        if cancelled:
+            self._rollback(items)
+        return ImportResult(items, cancelled)
+
+    def _rollback(self, items: List[ImportItem]) -> None:
+        """취소 시 이번 실행에서 새로 만든 저장소 파일 제거"""
+        for item in items:
+            if item.created and item.ref:
+                path = self.store.resolve(item.ref)
+                try:
+                    if os.path.exists(path):
+                        os.remove(path)
+                    self.store.forget(path)
+                except OSError as e:
+                    print(f"[ERROR] 가져오기 취소 정리 실패 {path}: {e}")
+                item.ref = ""
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 참조 카운트 색인
+페이지의 image_path/additional_images 참조 수를 이미지별로 유지하여
+참조가 0이 되는 순간 고아 이미지를 알 수 있게 합니다.
+전체 재검사(images/ 폴더 스캔)는 요청 시에만 백그라운드에서 실행합니다.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, List, Optional, Any, Iterable, Set, Callable, Tuple
+
+from image_store import IMAGE_EXTENSIONS, iter_page_image_refs
+
+INDEX_VERSION = 1
+
+
+class ImageRefIndex:
+    """이미지 경로 → 참조 수 색인 (디스크에 유지)"""
+
+    def __init__(self, index_file: str, resolve: Callable[[str], str]):
+        self.index_file = index_file
+        # 참조 문자열을 정규화된 절대 경로로 바꾸는 함수 (image_store.resolve)
+        self.resolve = resolve
+        self.counts: Dict[str, int] = {}
+        self.orphans: Set[str] = set()
+        # id(page) -> (페이지 객체, 마지막으로 반영한 참조 목록) (증분 갱신용)
+        # 페이지 객체를 함께 붙잡아 두어 항목이 남아 있는 동안 같은 id가 다른 페이지에 재사용되지 않음
+        self._page_refs: Dict[int, Tuple[Dict[str, Any], List[str]]] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    def _page_key_refs(self, page: Dict[str, Any]) -> List[str]:
+        return [self.resolve(ref) for ref in iter_page_image_refs(page)]
+
+    def _add(self, path: str) -> None:
+        self.counts[path] = self.counts.get(path, 0) + 1
+        self.orphans.discard(path)
+
+    def _remove(self, path: str, orphaned: List[str]) -> None:
+        count = self.counts.get(path, 0) - 1
+        if count > 0:
+            self.counts[path] = count
+        else:
+            self.counts.pop(path, None)
+            self.orphans.add(path)
+            orphaned.append(path)
+
+    def update_page(self, page: Dict[str, Any]) -> List[str]:
+        """페이지의 현재 참조를 반영하고 새로 고아가 된 이미지 목록 반환"""
+        orphaned: List[str] = []
+        with self._lock:
+            new_refs = self._page_key_refs(page)
+            old_refs = self._page_refs.get(id(page), (page, []))[1]
+            if new_refs == old_refs:
+                return orphaned
+            for path in new_refs:
+                self._add(path)
+            for path in old_refs:
+                self._remove(path, orphaned)
+            self._page_refs[id(page)] = (page, new_refs)
+            # 같은 경로를 새로 추가하고 이전 것을 뺀 경우는 고아가 아님
+            return [path for path in orphaned if path not in self.counts]
+
+    def update_pages(self, pages: Iterable[Dict[str, Any]]) -> List[str]:
+        orphaned: List[str] = []
+        for page in pages:
+            orphaned.extend(self.update_page(page))
+        return orphaned
+
+    def remove_pages(self, pages: Iterable[Dict[str, Any]]) -> List[str]:
+        """삭제되는 페이지들의 참조를 제거하고 고아가 된 이미지 목록 반환"""
+        orphaned: List[str] = []
+        with self._lock:
+            for page in pages:
+                for path in self._page_refs.pop(id(page), (page, []))[1]:
+                    self._remove(path, orphaned)
+            return list(dict.fromkeys(path for path in orphaned if path not in self.counts))
+
+    def ref_count(self, image_ref: str) -> int:
+        with self._lock:
+            return self.counts.get(self.resolve(image_ref), 0)
+
+    def is_referenced(self, image_ref: str) -> bool:
+        return self.ref_count(image_ref) > 0
+
+    def pop_orphans(self) -> List[str]:
+        """알려진 고아 이미지를 꺼내고 목록 비우기"""
+        with self._lock:
+            orphans = sorted(self.orphans)
+            self.orphans.clear()
+            return orphans
+
+    def discard_orphans(self, paths: Iterable[str]) -> None:
+        with self._lock:
+            for path in paths:
+                self.orphans.discard(path)
+
+    # ------------------------------------------------------------------
+    # 전체 재구성 / 재검사
+    # ------------------------------------------------------------------
+    def rebuild(self, books: Dict[str, Any]) -> None:
+        """메모리의 북 데이터로 카운트 재구성 (파일 시스템 접근 없음)"""
+        with self._lock:
+            self.counts.clear()
+            self._page_refs.clear()
+            for book_data in books.values():
+                if not isinstance(book_data, dict):
+                    continue
+                for page in book_data.get("pages", []):
+                    refs = self._page_key_refs(page)
+                    for path in refs:
+                        self.counts[path] = self.counts.get(path, 0) + 1
+                    self._page_refs[id(page)] = (page, refs)
+            self.orphans = {path for path in self.orphans if path not in self.counts}
+
+    def attach(self, books: Dict[str, Any]) -> None:
+        """디스크에서 읽은 카운트를 유지한 채 현재 페이지 객체와 연결"""
+        with self._lock:
+            self._page_refs.clear()
+            for book_data in books.values():
+                if not isinstance(book_data, dict):
+                    continue
+                for page in book_data.get("pages", []):
+                    self._page_refs[id(page)] = (page, self._page_key_refs(page))
+
+    def reconcile(self, books: Dict[str, Any], images_dir: str,
+                  progress_callback: Optional[Callable[[int, int], None]] = None,
+                  is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """전체 재검사: 참조를 다시 세고 images/ 폴더를 스캔해 고아/누락 이미지 확인
+
+        작업 스레드에서 호출하도록 설계되었습니다. books는 호출 시점의 스냅샷이어야 합니다.
+        """
+        counts: Dict[str, int] = {}
+        for book_data in books.values():
+            if not isinstance(book_data, dict):
+                continue
+            for page in book_data.get("pages", []):
+                for path in self._page_key_refs(page):
+                    counts[path] = counts.get(path, 0) + 1
+
+        on_disk: List[str] = []
+        images_dir = os.path.abspath(images_dir)
+        if os.path.isdir(images_dir):
+            for root, _, files in os.walk(images_dir):
+                for name in files:
+                    if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS:
+                        on_disk.append(os.path.normcase(os.path.normpath(os.path.join(root, name))))
+                if is_cancelled and is_cancelled():
+                    return {"cancelled": True}
+
+        orphans = []
+        total = len(on_disk)
+        for i, path in enumerate(on_disk, 1):
+            if path not in counts:
+                orphans.append(path)
+            if progress_callback and (i % 200 == 0 or i == total):
+                progress_callback(i, total)
+        disk_set = set(on_disk)
+        missing = [path for path in counts if path not in disk_set]
+
+        with self._lock:
+            self.counts = counts
+            self.orphans = set(orphans)
+        return {
+            "cancelled": False,
+            "referenced": len(counts),
+            "on_disk": total,
+            "orphans": orphans,
+            "missing": missing,
+        }
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    @staticmethod
+    def data_signature(data_file: str) -> Optional[str]:
+        try:
+            st = os.stat(data_file)
+        except OSError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def load(self, data_file: str) -> bool:
+        """색인 파일 로드. 데이터 파일 서명이 맞지 않으면 False (재구성 필요)"""
+        if not os.path.exists(self.index_file):
+            return False
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or \
+                    data.get("data_signature") != self.data_signature(data_file):
+                print("[DEBUG] 이미지 참조 색인이 데이터 파일과 맞지 않아 재구성합니다.")
+                return False
+            with self._lock:
+                self.counts = {path: int(count) for path, count in data.get("counts", {}).items()}
+                self.orphans = set(data.get("orphans", []))
+            return True
+        except Exception as e:
+            print(f"[ERROR] 이미지 참조 색인 로드 실패: {e}")
+            return False
+
+    def save(self, data_file: str) -> None:
+        """데이터 파일 저장 직후 호출 (데이터 파일 서명과 함께 저장)"""
+        with self._lock:
+            payload = {
+                "version": INDEX_VERSION,
+                "data_signature": self.data_signature(data_file),
+                "counts": self.counts,
+                "orphans": sorted(self.orphans),
+            }
+        try:
+            tmp_path = self.index_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            print(f"[ERROR] 이미지 참조 색인 저장 실패: {e}")
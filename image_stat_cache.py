@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 파일 stat 캐시
+images/ 폴더를 os.scandir로 한 번에 읽어 파일별 (크기, 수정시각)을 메모리에 두고,
+페이지 선택/내보내기/정리 등에서 반복되는 os.path.exists 호출을 대신합니다.
+
+폴더 변경은 QFileSystemWatcher로 감지해 잠시 모았다가 백그라운드에서 다시 스캔합니다.
+캐시에 없는 이미지(방금 저장한 파일 등)는 한 번만 stat해서 결과를 기억하므로
+같은 경로를 두 번 stat하지 않습니다. images/ 밖의 경로는 그대로 파일 시스템에 묻습니다.
+"""
+
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+
+# 폴더 변경 알림을 모으는 시간 (대량 복사 중 재스캔 반복 방지)
+RESCAN_DELAY_MS = 500
+
+
+def scan_directory(directory: str) -> Dict[str, Tuple[int, int]]:
+    """폴더의 파일 이름(normcase) -> (크기, 수정시각 ns)
+
+    Windows에서는 DirEntry.stat()이 디렉터리를 읽을 때 받은 정보를 쓰므로 파일별 시스템 호출이 없습니다.
+    """
+    entries: Dict[str, Tuple[int, int]] = {}
+    if not os.path.isdir(directory):
+        return entries
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                if not entry.is_file():
+                    continue
+                st = entry.stat()
+            except OSError:
+                continue
+            entries[os.path.normcase(entry.name)] = (st.st_size, st.st_mtime_ns)
+    return entries
+
+
+class ImageStatCache(QObject):
+    """images/ 폴더 파일의 존재 여부/크기 캐시 (조회는 어느 스레드에서나 가능)"""
+
+    # 재스캔이 끝나 캐시 내용이 바뀌었을 때
+    refreshed = Signal()
+    # 작업 스레드에서 스캔이 끝났음을 메인 스레드로 전달
+    _scan_done = Signal(object, int)
+
+    def __init__(self, images_dir: str, parent=None):
+        super().__init__(parent)
+        self.images_dir = os.path.normcase(os.path.abspath(images_dir))
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        # 한 번 stat해서 없다고 확인한 파일 이름 (폴더가 바뀌면 비움)
+        self._missing: Set[str] = set()
+        self._lock = threading.Lock()
+        self._ready = False
+        self._generation = 0
+        self.lookups = 0
+        self.fallback_stats = 0
+
+        self._scan_done.connect(self._on_scan_done)
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(RESCAN_DELAY_MS)
+        self._rescan_timer.timeout.connect(self.rescan)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watch_directory()
+        self.rescan()
+
+    def _watch_directory(self) -> None:
+        if os.path.isdir(self.images_dir) and self.images_dir not in [
+                os.path.normcase(path) for path in self._watcher.directories()]:
+            self._watcher.addPath(self.images_dir)
+
+    # ------------------------------------------------------------------
+    # 스캔
+    # ------------------------------------------------------------------
+    def rescan(self) -> None:
+        """백그라운드에서 폴더 전체를 다시 읽기 (끝나면 캐시를 통째로 교체)"""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+
+        def worker():
+            try:
+                entries = scan_directory(self.images_dir)
+            except Exception as e:
+                print(f"[ERROR] 이미지 폴더 스캔 실패: {e}")
+                return
+            self._scan_done.emit(entries, generation)
+
+        threading.Thread(target=worker, name="ImageStatScan", daemon=True).start()
+
+    def _on_scan_done(self, entries: Dict[str, Tuple[int, int]], generation: int) -> None:
+        with self._lock:
+            # 스캔 도중 다시 바뀌었으면 최신 스캔 결과를 기다림
+            if generation != self._generation:
+                return
+            self._entries = entries
+            self._missing.clear()
+            first = not self._ready
+            self._ready = True
+        # 폴더가 나중에 만들어진 경우 감시 시작
+        self._watch_directory()
+        if first:
+            print(f"[DEBUG] 이미지 stat 캐시 준비: {len(entries)}개")
+        self.refreshed.emit()
+
+    def _on_directory_changed(self, _path: str) -> None:
+        with self._lock:
+            # 새로 생긴 파일이 "없음"으로 남지 않도록 즉시 비움
+            self._missing.clear()
+        self._rescan_timer.start()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _split(self, path: str) -> Tuple[Optional[str], str]:
+        """images/ 바로 아래 파일이면 (캐시 키, 절대 경로), 아니면 (None, 절대 경로)"""
+        abs_path = os.path.abspath(path)
+        folder, name = os.path.split(os.path.normcase(abs_path))
+        return (name if folder == self.images_dir else None), abs_path
+
+    def stat(self, path: str) -> Optional[Tuple[int, int]]:
+        """(크기, 수정시각 ns), 없으면 None"""
+        if not path:
+            return None
+        key, abs_path = self._split(path)
+        with self._lock:
+            self.lookups += 1
+            if key is not None and self._ready:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    return entry
+                if key in self._missing:
+                    return None
+            self.fallback_stats += 1
+        # 캐시에 없는 경로만 한 번 stat (결과는 images/ 파일이면 기억)
+        try:
+            st = os.stat(abs_path)
+            entry = (st.st_size, st.st_mtime_ns)
+        except OSError:
+            entry = None
+        if key is not None and self._ready:
+            with self._lock:
+                if entry is None:
+                    self._missing.add(key)
+                else:
+                    self._entries[key] = entry
+        return entry
+
+    def exists(self, path: str) -> bool:
+        return self.stat(path) is not None
+
+    def size(self, path: str) -> int:
+        entry = self.stat(path)
+        return entry[0] if entry else 0
+
+    def names(self) -> List[str]:
+        """images/ 폴더의 파일 이름 목록 (스캔 전이면 직접 읽음)"""
+        with self._lock:
+            if self._ready:
+                return list(self._entries)
+        return list(scan_directory(self.images_dir))
+
+    # ------------------------------------------------------------------
+    # 앱이 직접 바꾼 파일 반영 (감시 알림보다 먼저 일관성 유지)
+    # ------------------------------------------------------------------
+    def discard(self, paths: Iterable[str]) -> None:
+        with self._lock:
+            for path in paths:
+                key, _ = self._split(path)
+                if key is not None:
+                    # 같은 이름으로 곧 다시 저장될 수 있으므로 "없음"으로 기록하지 않고 다음 조회 때 확인
+                    self._entries.pop(key, None)
+
+    def format_stats(self) -> str:
+        with self._lock:
+            return (f"이미지 stat 캐시: {len(self._entries)}개, 조회 {self.lookups}회, "
+                    f"직접 stat {self.fallback_stats}회")
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+내용 주소 기반 이미지 저장소
+images/ 폴더의 파일을 내용의 SHA-256 해시로 이름 지어 저장합니다.
+이미 저장된 이미지를 다시 가져오면 복사 없이 기존 파일 경로만 반환합니다.
+"""
+
+import os
+import re
+import shutil
+import hashlib
+import tempfile
+import threading
+from contextlib import nullcontext
+from typing import Dict, Optional, Any, Callable, BinaryIO, Tuple
+
+CHUNK_SIZE = 1024 * 1024
+IMAGE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.bmp', '.gif', '.tiff', '.tif', '.webp'}
+_DIGEST_NAME_RE = re.compile(r'^([0-9a-f]{64})(\.[A-Za-z0-9]+)$')
+_EXTENSION_ALIASES = {'.jpeg': '.jpg', '.tif': '.tiff'}
+
+
+def hash_file(path: str) -> str:
+    """파일 내용의 SHA-256 해시 계산 (스트리밍)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def normalize_extension(path: str) -> str:
+    """확장자를 소문자 대표 형태로 정규화"""
+    ext = os.path.splitext(path)[1].lower() or '.png'
+    return _EXTENSION_ALIASES.get(ext, ext)
+
+
+def file_signature(path: str) -> Optional[str]:
+    """변경 감지용 파일 서명 (없으면 None). 저장소 이미지는 파일명이 곧 내용 해시"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if _DIGEST_NAME_RE.match(os.path.basename(path)):
+        return "sha256"
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def iter_page_image_refs(page: Dict[str, Any]):
+    """페이지가 참조하는 모든 이미지 경로 (image_path + additional_images)"""
+    image_path = page.get("image_path", "")
+    if image_path:
+        yield image_path
+    for extra in page.get("additional_images", []) or []:
+        if extra:
+            yield extra
+
+
+class ContentAddressedImageStore:
+    """SHA-256 이름 기반 이미지 저장소"""
+
+    _instances: Dict[str, "ContentAddressedImageStore"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, images_dir: str, reference_base: Optional[str] = None):
+        self.images_dir = os.path.abspath(images_dir)
+        # 지정 시 반환 경로를 이 디렉토리 기준 상대경로로 만듦 (예: images/<hash>.png)
+        self.reference_base = os.path.abspath(reference_base) if reference_base else None
+        self._digest_to_name: Optional[Dict[str, str]] = None
+        self._lock = threading.RLock()
+        # 삭제 대기열 (PendingDeletionQueue). 지정하면 다시 쓰게 된 파일을 대기열에서 빼고,
+        # 그 확인과 삭제 스레드의 실제 삭제를 같은 잠금으로 배제
+        self.deletion_queue = None
+
+    @classmethod
+    def for_directory(cls, images_dir: str, reference_base: Optional[str] = None) -> "ContentAddressedImageStore":
+        """디렉토리별 공용 저장소 인스턴스 반환"""
+        key = os.path.abspath(images_dir)
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls(images_dir, reference_base)
+                cls._instances[key] = store
+            elif reference_base and not store.reference_base:
+                store.reference_base = os.path.abspath(reference_base)
+            return store
+
+    # ------------------------------------------------------------------
+    # 경로 처리
+    # ------------------------------------------------------------------
+    @staticmethod
+    def is_content_addressed(path: str) -> bool:
+        """파일명이 <sha256>.<ext> 형식인지 확인"""
+        return bool(path) and _DIGEST_NAME_RE.match(os.path.basename(path)) is not None
+
+    @staticmethod
+    def digest_from_path(path: str) -> Optional[str]:
+        match = _DIGEST_NAME_RE.match(os.path.basename(path or ""))
+        return match.group(1) if match else None
+
+    def resolve(self, reference: str) -> str:
+        """페이지 데이터의 이미지 참조를 절대 경로로 변환"""
+        if not reference:
+            return ""
+        path = reference.replace('\\', os.sep).replace('/', os.sep)
+        if not os.path.isabs(path) and not re.match(r'^[A-Za-z]:', reference):
+            path = os.path.join(self.reference_base or os.getcwd(), path)
+        return os.path.normcase(os.path.normpath(path))
+
+    def to_reference(self, abs_path: str) -> str:
+        """저장소 절대 경로를 페이지 데이터에 기록할 참조 문자열로 변환"""
+        if self.reference_base:
+            return os.path.relpath(abs_path, self.reference_base)
+        return abs_path
+
+    def _index(self) -> Dict[str, str]:
+        """digest -> 파일명 색인 (최초 호출 시 images/ 한 번 스캔)"""
+        with self._lock:
+            if self._digest_to_name is None:
+                self._digest_to_name = {}
+                if os.path.isdir(self.images_dir):
+                    with os.scandir(self.images_dir) as entries:
+                        for entry in entries:
+                            digest = self.digest_from_path(entry.name)
+                            if digest and entry.is_file():
+                                self._digest_to_name[digest] = entry.name
+            return self._digest_to_name
+
+    def lookup(self, digest: str) -> Optional[str]:
+        """해시에 해당하는 저장 파일의 절대 경로 (없으면 None)"""
+        name = self._index().get(digest)
+        if not name:
+            return None
+        path = os.path.join(self.images_dir, name)
+        if not os.path.exists(path):
+            with self._lock:
+                self._index().pop(digest, None)
+            return None
+        return path
+
+    def _register(self, digest: str, name: str) -> None:
+        with self._lock:
+            self._index()[digest] = name
+
+    def _deletion_guard(self):
+        queue = self.deletion_queue
+        return queue.deletion_lock if queue is not None else nullcontext()
+
+    def _claim(self, abs_path: str) -> None:
+        """반환할 저장 파일을 삭제 대기열에서 빼기 (_deletion_guard 안에서 호출)"""
+        if self.deletion_queue is not None:
+            self.deletion_queue.discard([os.path.normcase(os.path.normpath(abs_path))])
+
+    def forget(self, path: str) -> None:
+        """저장 파일이 삭제되었을 때 색인에서 제거"""
+        digest = self.digest_from_path(path)
+        if digest:
+            with self._lock:
+                if self._index().get(digest) == os.path.basename(path):
+                    del self._index()[digest]
+
+    # ------------------------------------------------------------------
+    # 가져오기
+    # ------------------------------------------------------------------
+    def import_file(self, src_path: str, digest: Optional[str] = None) -> str:
+        """파일을 저장소로 가져오고 참조 경로 반환 (이미 있으면 복사 생략)"""
+        return self.import_file_with_status(src_path, digest)[0]
+
+    def import_file_with_status(self, src_path: str, digest: Optional[str] = None) -> Tuple[str, bool]:
+        """import_file과 같지만 (참조 경로, 새로 저장했는지 여부)를 반환"""
+        if not src_path or not os.path.exists(src_path):
+            return "", False
+        digest = digest or hash_file(src_path)
+        with self._deletion_guard():
+            existing = self.lookup(digest)
+            if existing:
+                self._claim(existing)
+                return self.to_reference(existing), False
+
+        os.makedirs(self.images_dir, exist_ok=True)
+        name = f"{digest}{normalize_extension(src_path)}"
+        dest_path = os.path.join(self.images_dir, name)
+        created = os.path.abspath(src_path) != dest_path
+        if created:
+            fd, tmp_path = tempfile.mkstemp(prefix=".import_", dir=self.images_dir)
+            os.close(fd)
+            try:
+                shutil.copyfile(src_path, tmp_path)
+                with self._deletion_guard():
+                    os.replace(tmp_path, dest_path)
+                    self._claim(dest_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        else:
+            with self._deletion_guard():
+                self._claim(dest_path)
+        self._register(digest, name)
+        return self.to_reference(dest_path), created
+
+    def import_stream(self, stream: BinaryIO, ext: str) -> str:
+        """스트림을 읽으며 해시와 임시 저장을 동시에 수행 (zip 멤버 등)"""
+        os.makedirs(self.images_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(prefix=".import_", dir=self.images_dir)
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in iter(lambda: stream.read(CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    out.write(chunk)
+            return self.adopt_file(tmp_path, ext, digest.hexdigest())
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def adopt_file(self, tmp_path: str, ext: str, digest: Optional[str] = None) -> str:
+        """images 폴더 안에 써 둔 임시 파일을 해시 이름으로 옮겨 저장소에 등록 (복사 없음)
+
+        같은 내용이 이미 있으면 임시 파일을 지우고 기존 참조를 반환합니다.
+        """
+        digest = digest or hash_file(tmp_path)
+        with self._deletion_guard():
+            existing = self.lookup(digest)
+            if existing:
+                self._claim(existing)
+                os.remove(tmp_path)
+                return self.to_reference(existing)
+            name = f"{digest}{normalize_extension('x' + ext)}"
+            dest_path = os.path.join(self.images_dir, name)
+            os.replace(tmp_path, dest_path)
+            self._claim(dest_path)
+        self._register(digest, name)
+        return self.to_reference(dest_path)
+
+    def import_bytes(self, data: bytes, ext: str) -> str:
+        """메모리 데이터를 저장소로 가져오기"""
+        import io
+        return self.import_stream(io.BytesIO(data), ext)
+
+    # ------------------------------------------------------------------
+    # 마이그레이션
+    # ------------------------------------------------------------------
+    def migrate(self, books: Dict[str, Any],
+                progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+        """기존 images/ 폴더를 중복 제거하고 페이지 참조를 해시 경로로 재작성
+
+        파일은 해시 이름으로 링크(또는 복사)만 하고, 이전 파일 목록은
+        obsolete_files로 반환합니다. 호출자가 데이터를 저장한 뒤 삭제해야
+        중간에 종료되어도 참조가 깨지지 않습니다.
+        """
+        result = {
+            "scanned": 0,
+            "migrated": 0,
+            "duplicates": 0,
+            "bytes_saved": 0,
+            "references_updated": 0,
+            "obsolete_files": [],
+        }
+        if not os.path.isdir(self.images_dir):
+            return result
+
+        candidates = []
+        with os.scandir(self.images_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith('.'):
+                    continue
+                if os.path.splitext(entry.name)[1].lower() not in IMAGE_EXTENSIONS:
+                    continue
+                if self.is_content_addressed(entry.name):
+                    continue
+                candidates.append(entry.path)
+
+        mapping: Dict[str, str] = {}
+        total = len(candidates)
+        for i, path in enumerate(candidates, 1):
+            try:
+                size = os.path.getsize(path)
+                digest = hash_file(path)
+                with self._deletion_guard():
+                    existing = self.lookup(digest)
+                    if existing:
+                        self._claim(existing)
+                if existing:
+                    result["duplicates"] += 1
+                    result["bytes_saved"] += size
+                    target = existing
+                else:
+                    name = f"{digest}{normalize_extension(path)}"
+                    target = os.path.join(self.images_dir, name)
+                    try:
+                        os.link(path, target)
+                    except OSError:
+                        shutil.copy2(path, target)
+                    self._register(digest, name)
+                    result["migrated"] += 1
+                mapping[os.path.normcase(os.path.normpath(path))] = self.to_reference(target)
+                result["obsolete_files"].append(path)
+            except Exception as e:
+                print(f"[ERROR] 이미지 마이그레이션 실패 {os.path.basename(path)}: {e}")
+            result["scanned"] = i
+            if progress_callback:
+                progress_callback(i, total)
+
+        result["references_updated"] = self.rewrite_references(books, mapping)
+        return result
+
+    def rewrite_references(self, books: Dict[str, Any], mapping: Dict[str, str]) -> int:
+        """books 데이터의 image_path/additional_images 참조를 mapping에 따라 재작성"""
+        updated = 0
+        if not mapping:
+            return updated
+        for book_data in books.values():
+            if not isinstance(book_data, dict):
+                continue
+            for page in book_data.get("pages", []):
+                image_path = page.get("image_path", "")
+                if image_path:
+                    new_ref = mapping.get(self.resolve(image_path))
+                    if new_ref and new_ref != image_path:
+                        page["image_path"] = new_ref
+                        updated += 1
+                extras = page.get("additional_images")
+                if extras:
+                    new_extras = []
+                    for extra in extras:
+                        new_ref = mapping.get(self.resolve(extra)) if extra else None
+                        if new_ref and new_ref != extra:
+                            updated += 1
+                        new_extras.append(new_ref or extra)
+                    # 같은 페이지 안에서 중복된 참조 제거 (순서 유지)
+                    page["additional_images"] = list(dict.fromkeys(new_extras))
+        return updated
+
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 메타데이터 캐시
+이미지별 메타데이터(원시 필드 + NovelAI 파싱 결과)를 메모리와 디스크에 보관합니다.
+저장소 이미지(<sha256>.<ext>)는 내용 해시로, 그 외 파일은 경로+수정시각+크기로
+식별하므로 파일이 바뀌면 자동으로 다시 추출됩니다.
+"""
+
+import os
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Any, Callable, Tuple
+
+from image_metadata import extract_prompt_info
+from image_store import ContentAddressedImageStore
+
+CACHE_VERSION = 1
+
+
+def metadata_cache_key(path: str) -> Optional[str]:
+    """캐시 키 계산 (파일이 없으면 None)"""
+    digest = ContentAddressedImageStore.digest_from_path(path)
+    if digest:
+        return f"sha256:{digest}" if os.path.exists(path) else None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    abs_path = os.path.normcase(os.path.abspath(path))
+    return f"{abs_path}|{st.st_mtime_ns}|{st.st_size}"
+
+
+def _extract_worker(path: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """프로세스 풀 작업 함수 (모듈 최상위에 있어야 피클 가능)"""
+    try:
+        return path, extract_prompt_info(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+def extract_many(paths: List[str], cache: Optional["ImageMetadataCache"] = None,
+                 workers: Optional[int] = None,
+                 progress_callback: Optional[Callable[[int, int], None]] = None,
+                 is_cancelled: Optional[Callable[[], bool]] = None,
+                 on_result: Optional[Callable[[str, Optional[Dict[str, Any]]], None]] = None) -> Dict[str, Any]:
+    """여러 이미지의 메타데이터를 프로세스 풀에서 추출 (작업 스레드에서 호출)
+
+    캐시에 있는 이미지는 다시 읽지 않고, 새로 읽은 결과는 캐시에 저장합니다.
+    on_result는 이미지마다 (경로, 메타데이터) 로 호출됩니다.
+    """
+    total = len(paths)
+    done = 0
+    failed = 0
+    to_extract: List[str] = []
+    for path in paths:
+        cached = cache.get(path) if cache is not None else None
+        if cached is not None:
+            done += 1
+            if on_result:
+                on_result(path, cached)
+        else:
+            to_extract.append(path)
+    if progress_callback and done:
+        progress_callback(done, total)
+
+    cancelled = False
+    if to_extract:
+        workers = workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_extract_worker, path) for path in to_extract]
+            for future in as_completed(futures):
+                path, info, error = future.result()
+                if error:
+                    failed += 1
+                    print(f"[ERROR] 메타데이터 추출 실패 {os.path.basename(path)}: {error}")
+                else:
+                    if cache is not None and info is not None:
+                        cache.put(path, info)
+                    if on_result:
+                        on_result(path, info)
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total)
+                if is_cancelled and is_cancelled():
+                    cancelled = True
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    return {"total": total, "done": done, "failed": failed, "cancelled": cancelled}
+
+
+class ImageMetadataCache:
+    """메모리 + 디스크 메타데이터 캐시 (스레드 안전)"""
+
+    def __init__(self, cache_file: str, max_entries: int = 20000):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # 조회 / 추출
+    # ------------------------------------------------------------------
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """캐시된 메타데이터 (없거나 파일이 바뀌었으면 None)"""
+        key = metadata_cache_key(path)
+        if key is None:
+            return None
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, path: str, entry: Dict[str, Any]) -> None:
+        key = metadata_cache_key(path)
+        if key is None:
+            return
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def extract(self, path: str) -> Optional[Dict[str, Any]]:
+        """캐시에 있으면 반환하고, 없으면 추출해서 저장 (작업 스레드에서 호출)"""
+        entry = self.get(path)
+        if entry is not None:
+            return entry
+        try:
+            entry = extract_prompt_info(path)
+        except Exception as e:
+            print(f"[ERROR] 메타데이터 추출 실패 {os.path.basename(path)}: {e}")
+            return None
+        self.put(path, entry)
+        return entry
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                print("[DEBUG] 메타데이터 캐시 버전이 달라 새로 만듭니다.")
+                return
+            self._entries = OrderedDict(data.get("entries", {}))
+            print(f"[DEBUG] 메타데이터 캐시 로드: {len(self._entries)}개")
+        except Exception as e:
+            print(f"[ERROR] 메타데이터 캐시 로드 실패: {e}")
+
+    def save(self) -> None:
+        """변경된 경우에만 디스크에 기록"""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": CACHE_VERSION, "entries": self._entries}
+            try:
+                tmp_path = self.cache_file + ".tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(payload, f, ensure_ascii=False)
+                os.replace(tmp_path, self.cache_file)
+                self._dirty = False
+            except Exception as e:
+                print(f"[ERROR] 메타데이터 캐시 저장 실패: {e}")
+
+    def format_stats(self) -> str:
+        with self._lock:
+            total = self.hits + self.misses
+            rate = (self.hits / total * 100) if total else 0.0
+            return f"메타데이터 캐시: {len(self._entries)}개, 적중률 {rate:.1f}% ({self.hits}/{total})"
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+페이지 이미지 캐시
+3단계 캐시 구조:
+  1단계 - (북, 페이지)별 이미지 경로 목록 (LRU)
+  2단계 - 디코딩된 썸네일 QImage (메모리 바이트 예산 기반 LRU)
+  3단계 - 디스크 썸네일 저장소 (thumbnails/ 폴더의 PNG)
+"""
+
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Iterable, Any
+
+from PySide6.QtCore import Qt, QSize
+from PySide6.QtGui import QImage, QImageReader
+
+
+class CacheTierStats:
+    """캐시 단계별 적중률 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class PageImageCache:
+    """페이지 이미지 경로 목록과 썸네일을 함께 관리하는 다단계 캐시"""
+
+    DEFAULT_THUMBNAIL_SIZE = 128
+    SOURCE_SIGNATURE_KEY = "PromptBookSource"
+
+    def __init__(self, max_size: int = 10, thumbnail_budget_bytes: int = 64 * 1024 * 1024,
+                 disk_dir: Optional[str] = None, thumbnail_size: int = DEFAULT_THUMBNAIL_SIZE,
+                 perceptual_index=None):
+        self.max_size = max_size
+        self.thumbnail_budget_bytes = thumbnail_budget_bytes
+        self.disk_dir = disk_dir
+        self.thumbnail_size = thumbnail_size
+        # 기본 크기 썸네일을 만들거나 디스크에서 읽을 때 지각 해시도 함께 계산 (PerceptualHashIndex)
+        self.perceptual_index = perceptual_index
+
+        # 1단계: (book, page) -> [image_path, ...]
+        self._paths: "OrderedDict[tuple, List[str]]" = OrderedDict()
+        # 2단계: (image_path, size) -> QImage
+        self._thumbnails: "OrderedDict[tuple, QImage]" = OrderedDict()
+        self._thumbnail_bytes = 0
+        # 이미지 경로별로 사용된 썸네일 크기 (디스크 무효화용)
+        self._known_sizes: Dict[str, set] = {}
+
+        self._lock = threading.RLock()
+        self.stats = {
+            "paths": CacheTierStats("paths"),
+            "memory": CacheTierStats("memory"),
+            "disk": CacheTierStats("disk"),
+        }
+
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 1단계: 페이지별 이미지 경로 목록
+    # ------------------------------------------------------------------
+    def get(self, book_name: str, page_name: str) -> Optional[List[str]]:
+        """페이지 이미지 경로 목록 반환 (없으면 None)"""
+        key = (book_name, page_name)
+        with self._lock:
+            images = self._paths.get(key)
+            self.stats["paths"].record(images is not None)
+            if images is None:
+                return None
+            self._paths.move_to_end(key)
+            return list(images)
+
+    def put(self, book_name: str, page_name: str, images: List[str]) -> None:
+        """페이지 이미지 경로 목록 저장"""
+        key = (book_name, page_name)
+        with self._lock:
+            self._paths[key] = list(images)
+            self._paths.move_to_end(key)
+            while len(self._paths) > self.max_size:
+                self._paths.popitem(last=False)
+
+    def add_image_to_cache(self, book_name: str, page_name: str, image_path: str) -> None:
+        """캐시된 경로 목록에 이미지 추가 (캐시된 페이지인 경우에만)"""
+        key = (book_name, page_name)
+        with self._lock:
+            images = self._paths.get(key)
+            if images is not None and image_path not in images:
+                images.append(image_path)
+
+    def remove_image_from_cache(self, book_name: str, page_name: str, image_path: str) -> None:
+        """캐시된 경로 목록에서 이미지 제거"""
+        key = (book_name, page_name)
+        with self._lock:
+            images = self._paths.get(key)
+            if images is not None and image_path in images:
+                images.remove(image_path)
+
+    # ------------------------------------------------------------------
+    # 2/3단계: 썸네일
+    # ------------------------------------------------------------------
+    def get_thumbnail(self, image_path: str, size: Optional[int] = None,
+                      generate: bool = True) -> Optional[QImage]:
+        """썸네일 반환: 메모리 → 디스크 → 원본 디코딩 순으로 조회
+
+        QImage만 다루므로 작업 스레드에서도 호출할 수 있습니다.
+        """
+        size = size or self.thumbnail_size
+        key = (os.path.abspath(image_path), size)
+
+        with self._lock:
+            image = self._thumbnails.get(key)
+            self.stats["memory"].record(image is not None)
+            if image is not None:
+                self._thumbnails.move_to_end(key)
+        if image is not None:
+            # 메모리 적중이어도 해시가 없거나 오래됐으면 계산 (최신이면 서명 비교만 함)
+            self._observe(key, image)
+            return image
+
+        image = self._load_disk_thumbnail(key[0], size)
+        if image is None and generate:
+            image = self._decode_thumbnail(key[0], size)
+            if image is not None:
+                self._save_disk_thumbnail(key[0], size, image)
+
+        if image is not None:
+            self._store_thumbnail(key, image)
+            self._observe(key, image)
+        return image
+
+    def _observe(self, key: tuple, image: QImage) -> None:
+        """기본 크기 썸네일이면 지각 해시 색인에 반영"""
+        if self.perceptual_index is not None and key[1] == self.thumbnail_size:
+            self.perceptual_index.observe(key[0], image)
+
+    def thumbnail_file(self, image_path: str, size: Optional[int] = None) -> Optional[str]:
+        """디스크 썸네일 파일 경로 (없으면 만들어 저장, 디스크 단계가 없거나 실패하면 None)
+
+        툴팁처럼 이미지 대신 파일 경로가 필요한 곳에서 사용합니다.
+        """
+        size = size or self.thumbnail_size
+        if self.get_thumbnail(image_path, size) is None:
+            return None
+        disk_path = self._disk_path(os.path.abspath(image_path), size)
+        return disk_path if disk_path and os.path.exists(disk_path) else None
+
+    def put_thumbnail(self, image_path: str, image: QImage, size: Optional[int] = None,
+                      persist: bool = True) -> None:
+        """외부에서 만든 썸네일을 캐시에 등록"""
+        if image is None or image.isNull():
+            return
+        size = size or self.thumbnail_size
+        key = (os.path.abspath(image_path), size)
+        self._store_thumbnail(key, image)
+        if persist:
+            self._save_disk_thumbnail(key[0], size, image)
+
+    def _store_thumbnail(self, key: tuple, image: QImage) -> None:
+        cost = image.sizeInBytes()
+        if cost > self.thumbnail_budget_bytes:
+            return
+        with self._lock:
+            old = self._thumbnails.pop(key, None)
+            if old is not None:
+                self._thumbnail_bytes -= old.sizeInBytes()
+            self._thumbnails[key] = image
+            self._thumbnail_bytes += cost
+            self._known_sizes.setdefault(key[0], set()).add(key[1])
+            while self._thumbnail_bytes > self.thumbnail_budget_bytes and self._thumbnails:
+                _, evicted = self._thumbnails.popitem(last=False)
+                self._thumbnail_bytes -= evicted.sizeInBytes()
+
+    def _decode_thumbnail(self, image_path: str, size: int) -> Optional[QImage]:
+        """원본 이미지를 썸네일 크기로 디코딩 (가능하면 축소 디코딩)"""
+        if not os.path.exists(image_path):
+            return None
+        reader = QImageReader(image_path)
+        reader.setAutoTransform(True)
+        original = reader.size()
+        if original.isValid() and (original.width() > size or original.height() > size):
+            reader.setScaledSize(original.scaled(QSize(size, size), Qt.KeepAspectRatio))
+        image = reader.read()
+        if image.isNull():
+            print(f"[DEBUG] 썸네일 디코딩 실패: {os.path.basename(image_path)} ({reader.errorString()})")
+            return None
+        if image.width() > size or image.height() > size:
+            image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        return image
+
+    def _source_signature(self, image_path: str) -> Optional[str]:
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _disk_path(self, image_path: str, size: int) -> Optional[str]:
+        if not self.disk_dir:
+            return None
+        digest = hashlib.sha1(f"{image_path}|{size}".encode("utf-8")).hexdigest()
+        return os.path.join(self.disk_dir, digest[:2], f"{digest}.png")
+
+    def _load_disk_thumbnail(self, image_path: str, size: int) -> Optional[QImage]:
+        disk_path = self._disk_path(image_path, size)
+        if not disk_path:
+            return None
+        image = None
+        if os.path.exists(disk_path):
+            candidate = QImage(disk_path)
+            signature = self._source_signature(image_path)
+            if not candidate.isNull() and signature and \
+                    candidate.text(self.SOURCE_SIGNATURE_KEY) == signature:
+                image = candidate
+            else:
+                # 원본이 바뀌었거나 사라진 썸네일은 폐기
+                self._remove_file(disk_path)
+        with self._lock:
+            self.stats["disk"].record(image is not None)
+        return image
+
+    def _save_disk_thumbnail(self, image_path: str, size: int, image: QImage) -> None:
+        disk_path = self._disk_path(image_path, size)
+        signature = self._source_signature(image_path)
+        if not disk_path or not signature:
+            return
+        try:
+            os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+            stored = QImage(image)
+            stored.setText(self.SOURCE_SIGNATURE_KEY, signature)
+            tmp_path = disk_path + ".tmp"
+            if stored.save(tmp_path, "PNG"):
+                os.replace(tmp_path, disk_path)
+        except Exception as e:
+            print(f"[DEBUG] 디스크 썸네일 저장 실패: {e}")
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # ------------------------------------------------------------------
+    # 무효화 / 통계
+    # ------------------------------------------------------------------
+    def invalidate(self, book_name: Optional[str] = None, page_name: Optional[str] = None,
+                   image_paths: Optional[Iterable[str]] = None) -> None:
+        """단일 무효화 API
+
+        - book_name, page_name: 해당 페이지의 경로 목록(1단계) 폐기
+        - book_name만: 해당 북의 모든 페이지 경로 목록 폐기
+        - image_paths: 해당 이미지의 메모리/디스크 썸네일(2, 3단계) 폐기
+        """
+        with self._lock:
+            if book_name is not None:
+                if page_name is not None:
+                    self._paths.pop((book_name, page_name), None)
+                else:
+                    for key in [k for k in self._paths if k[0] == book_name]:
+                        del self._paths[key]
+
+            disk_targets = []
+            for image_path in image_paths or ():
+                abs_path = os.path.abspath(image_path)
+                sizes = self._known_sizes.pop(abs_path, set()) | {self.thumbnail_size}
+                for size in sizes:
+                    image = self._thumbnails.pop((abs_path, size), None)
+                    if image is not None:
+                        self._thumbnail_bytes -= image.sizeInBytes()
+                    disk_targets.append(self._disk_path(abs_path, size))
+
+        for disk_path in disk_targets:
+            if disk_path and os.path.exists(disk_path):
+                self._remove_file(disk_path)
+
+    def clear(self) -> None:
+        """메모리 캐시 전체 비우기 (디스크 저장소는 유지)"""
+        with self._lock:
+            self._paths.clear()
+            self._thumbnails.clear()
+            self._thumbnail_bytes = 0
+            self._known_sizes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """단계별 적중률 및 사용량 반환"""
+        with self._lock:
+            stats = {name: tier.to_dict() for name, tier in self.stats.items()}
+            stats["paths"]["entries"] = len(self._paths)
+            stats["memory"]["entries"] = len(self._thumbnails)
+            stats["memory"]["bytes"] = self._thumbnail_bytes
+            stats["memory"]["budget_bytes"] = self.thumbnail_budget_bytes
+            return stats
+
+    def format_stats(self) -> str:
+        """디버그 출력용 통계 문자열"""
+        stats = self.get_stats()
+        parts = []
+        for name in ("paths", "memory", "disk"):
+            tier = stats[name]
+            parts.append(f"{name} {tier['hits']}/{tier['hits'] + tier['misses']} ({tier['hit_rate'] * 100:.1f}%)")
+        parts.append(f"메모리 {stats['memory']['bytes'] / (1024 * 1024):.1f}MB")
+        return ", ".join(parts)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+지각 해시(perceptual hash) 색인
+썸네일을 9x8 흑백으로 줄여 이웃 픽셀 밝기 차이로 64비트 dHash를 만들고,
+해밍 거리 기준 BK-트리로 "비슷한 이미지" 검색과 중복 이미지 보고서를
+전체 비교 없이 처리합니다.
+
+해시는 썸네일을 만들 때(PageImageCache) 함께 계산되므로 원본을 다시 읽지 않으며,
+파일 서명(저장소 이미지는 해시, 그 외는 수정시각+크기)이 같으면 다시 계산하지 않습니다.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, List, Optional, Iterable, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage
+
+from image_store import file_signature
+
+INDEX_VERSION = 1
+HASH_WIDTH = 9
+HASH_HEIGHT = 8
+# 기본 검색 거리 (64비트 중 다른 비트 수)
+SIMILAR_DISTANCE = 10
+DUPLICATE_DISTANCE = 4
+
+
+def dhash_image(image: QImage) -> Optional[int]:
+    """QImage의 64비트 dHash (가로로 이웃한 픽셀의 밝기 비교)"""
+    if image is None or image.isNull():
+        return None
+    small = image.scaled(HASH_WIDTH, HASH_HEIGHT, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+    small = small.convertToFormat(QImage.Format_Grayscale8)
+    bits = bytes(small.constBits())
+    stride = small.bytesPerLine()
+    value = 0
+    for y in range(HASH_HEIGHT):
+        row = bits[y * stride:y * stride + HASH_WIDTH]
+        for x in range(HASH_WIDTH - 1):
+            value = (value << 1) | (1 if row[x] > row[x + 1] else 0)
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """해밍 거리 BK-트리 (같은 해시의 경로는 한 노드에 모음)"""
+
+    def __init__(self):
+        # 노드: [해시, 경로 목록, {거리: 자식 노드}]
+        self._root: Optional[list] = None
+
+    def add(self, value: int, path: str) -> None:
+        if self._root is None:
+            self._root = [value, [path], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(path)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [path], {}]
+                return
+            node = child
+
+    def search(self, value: int, max_distance: int) -> List[Tuple[int, str]]:
+        """거리 max_distance 이내의 (거리, 경로) 목록 (거리 순)"""
+        results: List[Tuple[int, str]] = []
+        if self._root is None:
+            return results
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= max_distance:
+                results.extend((distance, path) for path in node[1])
+            # 삼각 부등식: |d - k| <= max_distance 인 자식만 탐색
+            for edge, child in node[2].items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        results.sort()
+        return results
+
+
+class PerceptualHashIndex:
+    """이미지 경로 → dHash 색인 (디스크에 유지, 스레드 안전)"""
+
+    def __init__(self, index_file: str):
+        self.index_file = index_file
+        # 절대 경로 -> {"sig": 서명, "hash": 16진 문자열}
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self._tree: Optional[BKTree] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.load()
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def is_current(self, path: str) -> bool:
+        """해시가 있고 파일이 바뀌지 않았는지 (stat 1회)"""
+        sig = file_signature(path)
+        with self._lock:
+            entry = self.entries.get(self._key(path))
+            return sig is not None and entry is not None and entry.get("sig") == sig
+
+    def observe(self, path: str, image: QImage) -> None:
+        """썸네일에서 해시 계산 (이미 최신이면 건너뜀)"""
+        sig = file_signature(path)
+        if sig is None:
+            return
+        key = self._key(path)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry.get("sig") == sig:
+                return
+        value = dhash_image(image)
+        if value is None:
+            return
+        with self._lock:
+            old = self.entries.get(key)
+            self.entries[key] = {"sig": sig, "hash": f"{value:016x}"}
+            self._dirty = True
+            if self._tree is not None:
+                if old is not None:
+                    # 기존 노드를 빼는 대신 다음 검색 때 다시 만듦
+                    self._tree = None
+                else:
+                    self._tree.add(value, key)
+
+    def prune(self, keep_paths: Iterable[str]) -> int:
+        """더 이상 참조되지 않는 이미지 항목 제거"""
+        keep = {self._key(path) for path in keep_paths}
+        with self._lock:
+            stale = [key for key in self.entries if key not in keep]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self._tree = None
+                self._dirty = True
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def hash_for(self, path: str) -> Optional[int]:
+        with self._lock:
+            entry = self.entries.get(self._key(path))
+        return int(entry["hash"], 16) if entry else None
+
+    def _ensure_tree(self) -> BKTree:
+        if self._tree is None:
+            tree = BKTree()
+            for key, entry in self.entries.items():
+                tree.add(int(entry["hash"], 16), key)
+            self._tree = tree
+        return self._tree
+
+    def find_similar(self, path: str, max_distance: int = SIMILAR_DISTANCE) -> List[Tuple[int, str]]:
+        """path와 비슷한 이미지의 (거리, 경로) 목록 (자기 자신 제외)"""
+        value = self.hash_for(path)
+        if value is None:
+            return []
+        key = self._key(path)
+        with self._lock:
+            found = self._ensure_tree().search(value, max_distance)
+        return [(distance, other) for distance, other in found if other != key]
+
+    def duplicate_groups(self, max_distance: int = DUPLICATE_DISTANCE) -> List[List[str]]:
+        """거리 max_distance 이내로 이어지는 이미지 묶음 (2개 이상인 것만)"""
+        with self._lock:
+            tree = self._ensure_tree()
+            parent = {key: key for key in self.entries}
+
+            def find(key: str) -> str:
+                while parent[key] != key:
+                    parent[key] = parent[parent[key]]
+                    key = parent[key]
+                return key
+
+            for key, entry in self.entries.items():
+                for _, other in tree.search(int(entry["hash"], 16), max_distance):
+                    if other in parent:
+                        root_a, root_b = find(key), find(other)
+                        if root_a != root_b:
+                            parent[root_b] = root_a
+
+            groups: Dict[str, List[str]] = {}
+            for key in self.entries:
+                groups.setdefault(find(key), []).append(key)
+        result = [sorted(group) for group in groups.values() if len(group) > 1]
+        result.sort(key=len, reverse=True)
+        return result
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.entries)
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            with self._lock:
+                self.entries = dict(data.get("entries", {}))
+                self._tree = None
+        except Exception as e:
+            print(f"[ERROR] 이미지 해시 색인 로드 실패: {e}")
+
+    def save(self) -> None:
+        """변경된 경우에만 디스크에 기록"""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": INDEX_VERSION, "entries": dict(self.entries)}
+            self._dirty = False
+        try:
+            tmp_path = self.index_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            print(f"[ERROR] 이미지 해시 색인 저장 실패: {e}")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+이미지 내장 프롬프트 색인
+페이지가 참조하는 이미지(image_path/additional_images)에 저장된 프롬프트
+(NovelAI JSON, A1111 parameters 등)를 추출해 검색용 텍스트로 보관합니다.
+파일 서명(수정시각+크기, 저장소 이미지는 해시)이 같으면 다시 추출하지 않으므로
+중단 후 다시 실행하면 남은 이미지만 처리합니다.
+"""
+
+import os
+import json
+import threading
+from typing import Dict, List, Optional, Any, Callable
+
+from image_store import file_signature, iter_page_image_refs
+from metadata_cache import extract_many
+
+INDEX_VERSION = 1
+# 이 개수만큼 처리할 때마다 색인 파일 저장 (중단 후 이어서 처리)
+SAVE_INTERVAL = 200
+
+
+def search_text_from_info(info: Optional[Dict[str, Any]]) -> str:
+    """메타데이터에서 검색용 텍스트 (소문자) 생성"""
+    if not info:
+        return ""
+    text = info.get("parsed_prompt") or info.get("raw_prompt") or ""
+    return text.lower()
+
+
+class ImagePromptIndex:
+    """이미지 경로 → 내장 프롬프트 검색 텍스트 색인 (디스크에 유지)"""
+
+    def __init__(self, index_file: str, resolve: Callable[[str], str]):
+        self.index_file = index_file
+        # 참조 문자열을 정규화된 절대 경로로 바꾸는 함수 (image_store.resolve)
+        self.resolve = resolve
+        # 절대 경로 -> {"sig": 서명, "text": 검색 텍스트}
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.RLock()
+        self.load()
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def page_text(self, page: Dict[str, Any]) -> str:
+        """페이지의 모든 이미지에 내장된 프롬프트 검색 텍스트"""
+        with self._lock:
+            texts = []
+            for ref in iter_page_image_refs(page):
+                entry = self.entries.get(self.resolve(ref))
+                if entry and entry.get("text"):
+                    texts.append(entry["text"])
+            return "\n".join(texts)
+
+    def matches(self, page: Dict[str, Any], query: str) -> bool:
+        """검색어(소문자)가 페이지 이미지의 프롬프트에 포함되는지"""
+        return bool(query) and query in self.page_text(page)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.entries)
+
+    # ------------------------------------------------------------------
+    # 색인 작업
+    # ------------------------------------------------------------------
+    def collect_pending(self, books: Dict[str, Any]) -> List[str]:
+        """새로 추가되었거나 바뀐 이미지 경로 목록 (파일 시스템 stat만 수행)"""
+        pending: List[str] = []
+        seen = set()
+        with self._lock:
+            for book_data in books.values():
+                if not isinstance(book_data, dict):
+                    continue
+                for page in book_data.get("pages", []):
+                    for ref in iter_page_image_refs(page):
+                        path = self.resolve(ref)
+                        if path in seen:
+                            continue
+                        seen.add(path)
+                        sig = file_signature(path)
+                        if sig is None:
+                            continue
+                        entry = self.entries.get(path)
+                        if entry is None or entry.get("sig") != sig:
+                            pending.append(path)
+            # 더 이상 참조되지 않는 항목 정리
+            for path in [path for path in self.entries if path not in seen]:
+                del self.entries[path]
+        return pending
+
+    def set_entry(self, path: str, info: Optional[Dict[str, Any]]) -> None:
+        sig = file_signature(path)
+        if sig is None:
+            return
+        with self._lock:
+            self.entries[path] = {"sig": sig, "text": search_text_from_info(info)}
+
+    def build(self, paths: List[str], metadata_cache=None, workers: Optional[int] = None,
+              progress_callback: Optional[Callable[[int, int], None]] = None,
+              is_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+        """이미지 목록의 프롬프트를 프로세스 풀에서 추출해 색인에 반영 (작업 스레드에서 호출)
+
+        메타데이터 캐시에 이미 있는 이미지는 다시 읽지 않고, 새로 읽은 결과는 캐시에도 저장합니다.
+        """
+        processed = [0]
+
+        def on_result(path: str, info: Optional[Dict[str, Any]]) -> None:
+            self.set_entry(path, info)
+            processed[0] += 1
+            if processed[0] % SAVE_INTERVAL == 0:
+                self.save()
+
+        result = extract_many(paths, cache=metadata_cache, workers=workers,
+                              progress_callback=progress_callback,
+                              is_cancelled=is_cancelled, on_result=on_result)
+        self.save()
+        return {"total": result["total"], "indexed": processed[0],
+                "failed": result["failed"], "cancelled": result["cancelled"]}
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
+    def load(self) -> None:
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return
+            with self._lock:
+                self.entries = dict(data.get("entries", {}))
+        except Exception as e:
+            print(f"[ERROR] 프롬프트 색인 로드 실패: {e}")
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {"version": INDEX_VERSION, "entries": dict(self.entries)}
+        try:
+            tmp_path = self.index_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            print(f"[ERROR] 프롬프트 색인 저장 실패: {e}")
@@ -23,7 +23,10 @@ class PromptBookEventHandlers:
                 if PromptBookUtils.is_valid_image(file_path):
                     new_path = PromptBookUtils.handle_image_copy(file_path)
                     if new_path:
-                        parent.state.characters[parent.state.current_index]["image_path"] = new_path
+                        page = parent.state.characters[parent.state.current_index]
+                        page["image_path"] = new_path
+                        if hasattr(parent, 'image_refs'):
+                            parent.image_refs.update_page(page)
                         parent.state.edited = True
                         parent.update_image_view(new_path)
                     break
@@ -1,6 +1,6 @@
 import os
-import shutil
 from typing import Set, Dict, Any
+from image_store import ContentAddressedImageStore
 
 class PromptBookUtils:
     @staticmethod
@@ -28,17 +28,13 @@ class PromptBookUtils:
 
     @staticmethod
     def handle_image_copy(src_path: str, dest_dir: str = "images") -> str:
-        """이미지 파일을 지정된 디렉토리로 복사"""
+        """이미지 파일을 지정된 디렉토리의 해시 기반 저장소로 가져오기 (중복 시 복사 생략)"""
         if not src_path or not os.path.exists(src_path):
             return ""
-            
-        os.makedirs(dest_dir, exist_ok=True)
-        filename = os.path.basename(src_path)
-        dest_path = os.path.join(dest_dir, filename)
         
         try:
-            shutil.copy(src_path, dest_path)
-            return dest_path
+            store = ContentAddressedImageStore.for_directory(dest_dir)
+            return os.path.join(dest_dir, os.path.basename(store.import_file(src_path)))
         except Exception as e:
             print(f"이미지 복사 실패: {e}")
             return ""
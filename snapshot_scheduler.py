@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+자동 스냅샷 예약
+편집(저장)이 멈추고 N분이 지나거나 저장이 M번 쌓이면 증분 백업을 하나 만들도록 알리고,
+오래된 자동 스냅샷은 시간/일/주 단위로 하나씩만 남겨 정리합니다.
+백업 폴더 전체가 디스크 예산을 넘으면 남은 자동 스냅샷을 오래된 것부터 지웁니다
+(직접 만든 백업은 지우지 않습니다).
+
+스냅샷 작성과 정리는 모두 작업 스레드에서 하며, 이 모듈의 QObject는 시점만 결정합니다.
+"""
+
+import os
+import time
+import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from backup_archive import BlobStore
+
+SNAPSHOT_PREFIX = "auto_snapshot_"
+SNAPSHOT_EXTENSION = ".pbk"
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+# 유휴 조건 확인 주기
+CHECK_INTERVAL_MS = 30 * 1000
+
+DEFAULT_SNAPSHOT_SETTINGS = {
+    "enabled": True,
+    "idle_minutes": 10,     # 마지막 저장 후 이만큼 조용하면 스냅샷 (0이면 사용 안 함)
+    "save_interval": 20,    # 저장 횟수 기준 (0이면 사용 안 함)
+    "keep_hourly": 24,
+    "keep_daily": 7,
+    "keep_weekly": 4,
+    "budget_mb": 2048,      # 백업 폴더 전체 디스크 예산 (0이면 제한 없음)
+}
+
+
+def snapshot_filename(timestamp: str) -> str:
+    return f"{SNAPSHOT_PREFIX}{timestamp}{SNAPSHOT_EXTENSION}"
+
+
+def parse_snapshot_time(filename: str) -> Optional[datetime.datetime]:
+    """자동 스냅샷 파일 이름이면 생성 시각, 아니면 None"""
+    if not (filename.startswith(SNAPSHOT_PREFIX) and filename.endswith(SNAPSHOT_EXTENSION)):
+        return None
+    try:
+        return datetime.datetime.strptime(
+            filename[len(SNAPSHOT_PREFIX):-len(SNAPSHOT_EXTENSION)], TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def list_snapshots(backup_dir: str) -> List[Tuple[str, datetime.datetime]]:
+    """자동 스냅샷 (경로, 생성 시각) 목록 (최신순)"""
+    snapshots = []
+    if os.path.isdir(backup_dir):
+        for name in os.listdir(backup_dir):
+            created = parse_snapshot_time(name)
+            if created is not None:
+                snapshots.append((os.path.join(backup_dir, name), created))
+    snapshots.sort(key=lambda item: item[1], reverse=True)
+    return snapshots
+
+
+def select_retained(snapshots: List[Tuple[str, datetime.datetime]],
+                    keep_hourly: int, keep_daily: int, keep_weekly: int) -> Set[str]:
+    """남길 스냅샷 경로 집합 (각 시간/일/주 구간의 가장 최신 것, 최근 구간부터 지정 개수만큼)
+
+    가장 최신 스냅샷은 항상 남깁니다. snapshots는 최신순이어야 합니다.
+    """
+    tiers = [
+        (keep_hourly, lambda t: (t.year, t.month, t.day, t.hour)),
+        (keep_daily, lambda t: (t.year, t.month, t.day)),
+        (keep_weekly, lambda t: tuple(t.isocalendar()[:2])),
+    ]
+    keep: Set[str] = set()
+    if snapshots:
+        keep.add(snapshots[0][0])
+    for limit, bucket_of in tiers:
+        seen = set()
+        for path, created in snapshots:
+            if len(seen) >= limit:
+                break
+            bucket = bucket_of(created)
+            if bucket not in seen:
+                seen.add(bucket)
+                keep.add(path)
+    return keep
+
+
+def directory_size(path: str) -> int:
+    total = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def prune_snapshots(backup_dir: str, blob_store: BlobStore, settings: Dict[str, Any],
+                    on_removed: Optional[Callable[[str], None]] = None,
+                    is_cancelled: Optional[Callable[[], bool]] = None) -> Tuple[List[str], int]:
+    """보존 규칙과 디스크 예산에 맞춰 자동 스냅샷 정리 → (지운 경로 목록, 확보한 바이트)
+
+    취소되면 지우던 스냅샷까지만 정리하고 멈춥니다 (남은 블롭은 다음 정리 때 지움).
+    """
+    def cancelled() -> bool:
+        return bool(is_cancelled and is_cancelled())
+
+    before = directory_size(backup_dir)
+    snapshots = list_snapshots(backup_dir)
+    keep = select_retained(snapshots, int(settings.get("keep_hourly", 0)),
+                           int(settings.get("keep_daily", 0)), int(settings.get("keep_weekly", 0)))
+    removed: List[str] = []
+
+    def remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"[ERROR] 스냅샷 삭제 실패 {os.path.basename(path)}: {e}")
+            return
+        removed.append(path)
+        if on_removed:
+            on_removed(path)
+
+    for path, _created in snapshots:
+        if cancelled():
+            return removed, max(0, before - directory_size(backup_dir))
+        if path not in keep:
+            remove(path)
+    if removed and not cancelled():
+        blob_store.collect_garbage(backup_dir)
+
+    # 예산 초과: 가장 최신 스냅샷 하나는 남기고 오래된 것부터 삭제
+    budget = int(settings.get("budget_mb", 0)) * 1024 * 1024
+    if budget > 0 and not cancelled():
+        kept = [path for path, _created in snapshots if path in keep]
+        usage = directory_size(backup_dir)
+        while usage > budget and len(kept) > 1 and not cancelled():
+            remove(kept.pop())
+            blob_store.collect_garbage(backup_dir)
+            usage = directory_size(backup_dir)
+        if usage > budget and not cancelled():
+            print(f"[DEBUG] 백업 폴더가 예산을 넘음 ({usage / (1024 * 1024):.0f}MB, 직접 만든 백업은 유지)")
+
+    return removed, max(0, before - directory_size(backup_dir))
+
+
+class SnapshotScheduler(QObject):
+    """저장 횟수와 유휴 시간으로 자동 스냅샷 시점을 알림 (메인 스레드에서 사용)"""
+
+    # 스냅샷을 만들 때가 됨 ("idle" 또는 "saves")
+    snapshot_due = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.settings = dict(DEFAULT_SNAPSHOT_SETTINGS)
+        self._saves_since = 0
+        self._last_save = time.monotonic()
+        self._dirty = False
+        self._in_progress = False
+        self._timer = QTimer(self)
+        self._timer.setInterval(CHECK_INTERVAL_MS)
+        self._timer.timeout.connect(self._check_idle)
+
+    def configure(self, settings: Dict[str, Any]) -> None:
+        self.settings = dict(DEFAULT_SNAPSHOT_SETTINGS, **settings)
+        if self.settings["enabled"]:
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.settings.get("enabled"))
+
+    def note_save(self) -> None:
+        """라이브러리 저장 직후 호출"""
+        self._dirty = True
+        self._saves_since += 1
+        self._last_save = time.monotonic()
+        interval = int(self.settings.get("save_interval", 0))
+        if self.enabled and interval > 0 and self._saves_since >= interval:
+            self._emit_due("saves")
+
+    def _check_idle(self) -> None:
+        idle_minutes = float(self.settings.get("idle_minutes", 0))
+        if (self.enabled and self._dirty and idle_minutes > 0
+                and time.monotonic() - self._last_save >= idle_minutes * 60):
+            self._emit_due("idle")
+
+    def _emit_due(self, reason: str) -> None:
+        if not self._in_progress:
+            self.snapshot_due.emit(reason)
+
+    def mark_started(self) -> None:
+        self._in_progress = True
+        self._saves_since = 0
+        self._dirty = False
+
+    def mark_finished(self, success: bool) -> None:
+        """실패하거나 취소되면 다음 확인 때 다시 시도"""
+        self._in_progress = False
+        if not success:
+            self._dirty = True
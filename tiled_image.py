@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+큰 이미지용 타일 렌더링
+이미지를 해상도 단계(LOD)별 타일 피라미드로 나눠 디스크에 저장해 두고,
+이미지 뷰에서는 현재 확대 배율에 맞는 단계의 타일 중 화면에 보이는 것만
+비동기로 읽어 그립니다. 원본 해상도 픽스맵을 메모리에 두지 않습니다.
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QRectF, QSize, Signal
+from PySide6.QtGui import QImage, QImageReader, QImageIOHandler, QPixmap, QPainter
+from PySide6.QtWidgets import QGraphicsObject, QGraphicsItem, QStyleOptionGraphicsItem
+
+TILE_SIZE = 512
+# 이보다 픽셀 수가 많은 이미지는 타일로 표시 (예: 8K 렌더)
+LARGE_IMAGE_PIXELS = 12_000_000
+# 미리보기(가장 작은 단계) 이미지의 긴 변 최대 길이
+PREVIEW_SIZE = 1024
+# 메모리에 유지할 타일 수 (512x512 RGBA 기준 약 1MB씩)
+MAX_RESIDENT_TILES = 96
+# 타일 캐시의 디스크 예산 (넘으면 오래 사용하지 않은 피라미드부터 삭제, 가장 최근 것은 유지)
+MAX_CACHE_BYTES = 1024 * 1024 * 1024
+# 이보다 오래된 임시 폴더는 중단된 빌드가 남긴 것으로 보고 삭제 (초)
+STALE_TMP_SECONDS = 60 * 60
+_DONE_MARKER = "complete"
+
+
+def oriented_size(path: str) -> QSize:
+    """EXIF 회전을 반영한 이미지 크기 (디코딩 없음)"""
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    size = reader.size()
+    if size.isValid() and reader.transformation() & QImageIOHandler.TransformationRotate90:
+        size = QSize(size.height(), size.width())
+    return size
+
+
+def is_large_image(size: QSize) -> bool:
+    return size.isValid() and size.width() * size.height() > LARGE_IMAGE_PIXELS
+
+
+class TilePyramid:
+    """이미지 한 장의 LOD 타일 피라미드 (디스크 저장)"""
+
+    def __init__(self, source_path: str, size: QSize, cache_root: str):
+        self.source_path = source_path
+        self.width = size.width()
+        self.height = size.height()
+        try:
+            st = os.stat(source_path)
+            signature = f"{os.path.abspath(source_path)}|{st.st_mtime_ns}|{st.st_size}"
+        except OSError:
+            signature = os.path.abspath(source_path)
+        self.cache_root = cache_root
+        self.directory = os.path.join(cache_root, hashlib.sha1(signature.encode('utf-8')).hexdigest())
+
+        # 단계 0 = 원본 해상도, 단계가 올라갈 때마다 1/2
+        self.levels: List[Tuple[float, int, int]] = []
+        scale = 1.0
+        width, height = self.width, self.height
+        while True:
+            self.levels.append((scale, width, height))
+            if max(width, height) <= PREVIEW_SIZE:
+                break
+            scale /= 2
+            width, height = max(1, (width + 1) // 2), max(1, (height + 1) // 2)
+
+    @property
+    def preview_level(self) -> int:
+        return len(self.levels) - 1
+
+    def is_built(self) -> bool:
+        return os.path.exists(os.path.join(self.directory, _DONE_MARKER))
+
+    def touch(self) -> None:
+        try:
+            os.utime(self.directory)
+        except OSError:
+            pass
+
+    def tile_path(self, level: int, col: int, row: int) -> str:
+        return os.path.join(self.directory, f"L{level}_{col}_{row}.png")
+
+    def preview_path(self) -> str:
+        return os.path.join(self.directory, "preview.png")
+
+    def level_for_scale(self, view_scale: float) -> int:
+        """뷰 배율(원본 픽셀당 화면 픽셀)에 맞는 단계 - 화면보다 해상도가 낮지 않은 가장 작은 단계"""
+        level = 0
+        for i, (scale, _, _) in enumerate(self.levels):
+            if scale >= view_scale:
+                level = i
+        return level
+
+    def tiles_in_rect(self, level: int, rect: QRectF) -> List[Tuple[int, int, QRectF]]:
+        """원본 좌표 rect와 겹치는 타일 목록 (열, 행, 원본 좌표 영역)"""
+        scale, width, height = self.levels[level]
+        span = TILE_SIZE / scale  # 타일 하나가 덮는 원본 픽셀 수
+        cols = (width + TILE_SIZE - 1) // TILE_SIZE
+        rows = (height + TILE_SIZE - 1) // TILE_SIZE
+        first_col = max(0, int(rect.left() // span))
+        last_col = min(cols - 1, int(rect.right() // span))
+        first_row = max(0, int(rect.top() // span))
+        last_row = min(rows - 1, int(rect.bottom() // span))
+        tiles = []
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                tile_width = min(TILE_SIZE, width - col * TILE_SIZE)
+                tile_height = min(TILE_SIZE, height - row * TILE_SIZE)
+                tiles.append((col, row, QRectF(col * span, row * span, tile_width / scale, tile_height / scale)))
+        return tiles
+
+    def build(self, is_cancelled=None) -> Optional[QImage]:
+        """원본을 한 번 디코딩해 모든 단계의 타일을 저장하고 미리보기 이미지 반환 (작업 스레드)"""
+        reader = QImageReader(self.source_path)
+        reader.setAutoTransform(True)
+        image = reader.read()
+        if image.isNull():
+            print(f"[ERROR] 타일 생성용 이미지 로드 실패: {self.source_path}")
+            return None
+
+        # 빌드마다 따로 만든 임시 폴더 사용 (취소된 빌드가 같은 이미지의 새 빌드 타일을 지우지 않도록)
+        # .tmp로 끝나야 prune_tile_cache가 건드리지 않음
+        os.makedirs(self.cache_root, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=os.path.basename(self.directory) + "_", suffix=".tmp", dir=self.cache_root)
+        for level, (_, width, height) in enumerate(self.levels):
+            if is_cancelled and is_cancelled():
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return None
+            if level > 0:
+                # 직전 단계를 절반으로 줄여 다음 단계 생성 (원본 해상도 이미지는 여기서 해제됨)
+                image = image.scaled(width, height, Qt.IgnoreAspectRatio, Qt.SmoothTransformation)
+            for row in range((height + TILE_SIZE - 1) // TILE_SIZE):
+                for col in range((width + TILE_SIZE - 1) // TILE_SIZE):
+                    tile = image.copy(col * TILE_SIZE, row * TILE_SIZE,
+                                      min(TILE_SIZE, width - col * TILE_SIZE),
+                                      min(TILE_SIZE, height - row * TILE_SIZE))
+                    # 기본 압축 (품질 100은 zlib 0단계라 8K 피라미드가 수백 MB가 됨)
+                    tile.save(os.path.join(tmp_dir, f"L{level}_{col}_{row}.png"), "PNG")
+        image.save(os.path.join(tmp_dir, "preview.png"), "PNG")
+        with open(os.path.join(tmp_dir, _DONE_MARKER), 'w', encoding='utf-8') as f:
+            f.write(f"{self.width}x{self.height}")
+        shutil.rmtree(self.directory, ignore_errors=True)
+        try:
+            os.replace(tmp_dir, self.directory)
+        except OSError:
+            # 같은 이미지의 다른 빌드가 먼저 끝나 폴더를 채움 → 그쪽 결과 사용
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        prune_tile_cache(self.cache_root)
+        return image
+
+
+def _pyramid_bytes(path: str) -> int:
+    total = 0
+    try:
+        with os.scandir(path) as files:
+            for entry in files:
+                if entry.is_file():
+                    total += entry.stat().st_size
+    except OSError:
+        pass
+    return total
+
+
+def prune_tile_cache(cache_root: str, max_bytes: int = MAX_CACHE_BYTES) -> None:
+    """오래 사용하지 않은 피라미드와 중단된 빌드의 임시 폴더 삭제"""
+    try:
+        dirs = [entry for entry in os.scandir(cache_root) if entry.is_dir()]
+    except OSError:
+        return
+    entries = []
+    for entry in dirs:
+        if not entry.name.endswith(".tmp"):
+            entries.append(entry)
+        elif time.time() - entry.stat().st_mtime > STALE_TMP_SECONDS:
+            shutil.rmtree(entry.path, ignore_errors=True)
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    used = 0
+    for index, entry in enumerate(entries):
+        used += _pyramid_bytes(entry.path)
+        if index > 0 and used > max_bytes:
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+class _TileHub(QObject):
+    """작업 스레드 → UI 스레드 전달용 신호 모음 (모듈 전역 하나)"""
+    tile_loaded = Signal(int, object, QImage)  # 아이템 토큰, (단계, 열, 행), 타일 이미지
+    pyramid_ready = Signal(int, QImage)  # 아이템 토큰, 미리보기 이미지 (실패 시 null)
+
+    def __init__(self):
+        super().__init__()
+        self.items: Dict[int, "TiledImageItem"] = {}
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(max(2, min(4, QThreadPool.globalInstance().maxThreadCount())))
+        self.tile_loaded.connect(self._deliver_tile)
+        self.pyramid_ready.connect(self._deliver_pyramid)
+
+    def _item(self, token: int) -> Optional["TiledImageItem"]:
+        item = self.items.get(token)
+        if item is None:
+            return None
+        try:
+            # 씬에서 삭제된 아이템이면 RuntimeError
+            item.scene()
+        except RuntimeError:
+            self.items.pop(token, None)
+            return None
+        return item
+
+    def _deliver_tile(self, token, key, image):
+        item = self._item(token)
+        if item is not None:
+            item.on_tile_loaded(key, image)
+
+    def _deliver_pyramid(self, token, preview):
+        item = self._item(token)
+        if item is not None:
+            item.on_pyramid_ready(preview)
+
+
+_hub: Optional[_TileHub] = None
+_token_lock = threading.Lock()
+_next_token = 0
+
+
+def _get_hub() -> _TileHub:
+    global _hub
+    if _hub is None:
+        _hub = _TileHub()
+    return _hub
+
+
+class _BuildTask(QRunnable):
+    def __init__(self, token: int, pyramid: TilePyramid):
+        super().__init__()
+        self.token = token
+        self.pyramid = pyramid
+
+    def run(self):
+        hub = _get_hub()
+        try:
+            preview = self.pyramid.build(is_cancelled=lambda: self.token not in hub.items)
+        except Exception as e:
+            print(f"[ERROR] 타일 피라미드 생성 실패: {e}")
+            preview = None
+        hub.pyramid_ready.emit(self.token, preview if preview is not None else QImage())
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, token: int, key: Tuple[int, int, int], path: str):
+        super().__init__()
+        self.token = token
+        self.key = key
+        self.path = path
+
+    def run(self):
+        hub = _get_hub()
+        if self.token not in hub.items:
+            return
+        hub.tile_loaded.emit(self.token, self.key, QImage(self.path))
+
+
+class TiledImageItem(QGraphicsObject):
+    """LOD 타일로 그리는 큰 이미지 아이템 (씬 좌표 = 원본 픽셀 좌표)"""
+
+    def __init__(self, path: str, size: QSize, cache_root: str, parent=None):
+        super().__init__(parent)
+        global _next_token
+        with _token_lock:
+            _next_token += 1
+            self.token = _next_token
+        self.path = path
+        self.pyramid = TilePyramid(path, size, cache_root)
+        self._bounds = QRectF(0, 0, size.width(), size.height())
+        self._preview: Optional[QPixmap] = None
+        self._tiles: "OrderedDict[Tuple[int, int, int], QPixmap]" = OrderedDict()
+        self._pending: set = set()
+        self._ready = False
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)
+
+        hub = _get_hub()
+        hub.items[self.token] = self
+        if self.pyramid.is_built():
+            self.pyramid.touch()
+            preview = QImage(self.pyramid.preview_path())
+            self.on_pyramid_ready(preview)
+        else:
+            hub.pool.start(_BuildTask(self.token, self.pyramid))
+
+    def release(self) -> None:
+        """진행 중인 작업 중단 및 타일 해제 (씬에서 제거되기 전 호출)"""
+        _get_hub().items.pop(self.token, None)
+        self._tiles.clear()
+        self._pending.clear()
+
+    def boundingRect(self) -> QRectF:
+        return self._bounds
+
+    @property
+    def resident_tiles(self) -> int:
+        return len(self._tiles)
+
+    # ------------------------------------------------------------------
+    # 비동기 결과 처리
+    # ------------------------------------------------------------------
+    def on_pyramid_ready(self, preview: QImage) -> None:
+        if not preview.isNull():
+            self._preview = QPixmap.fromImage(preview)
+            self._ready = True
+        self.update()
+
+    def on_tile_loaded(self, key: Tuple[int, int, int], image: QImage) -> None:
+        self._pending.discard(key)
+        if image.isNull():
+            return
+        self._tiles[key] = QPixmap.fromImage(image)
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > MAX_RESIDENT_TILES:
+            self._tiles.popitem(last=False)
+        level, col, row = key
+        for tile_col, tile_row, rect in self.pyramid.tiles_in_rect(level, self._bounds):
+            if tile_col == col and tile_row == row:
+                self.update(rect)
+                break
+
+    # ------------------------------------------------------------------
+    # 그리기
+    # ------------------------------------------------------------------
+    def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget=None) -> None:
+        exposed = option.exposedRect.intersected(self._bounds)
+        if self._preview is not None:
+            # 타일이 아직 없는 부분은 미리보기를 늘려 그림
+            preview_scale = self._preview.width() / self._bounds.width()
+            source = QRectF(exposed.left() * preview_scale, exposed.top() * preview_scale,
+                            exposed.width() * preview_scale, exposed.height() * preview_scale)
+            painter.drawPixmap(exposed, self._preview, source)
+        if not self._ready:
+            return
+
+        view_scale = painter.worldTransform().m11()
+        level = self.pyramid.level_for_scale(view_scale)
+        if level == self.pyramid.preview_level:
+            # 미리보기 해상도로 충분함
+            return
+        hub = _get_hub()
+        for col, row, rect in self.pyramid.tiles_in_rect(level, exposed):
+            key = (level, col, row)
+            pixmap = self._tiles.get(key)
+            if pixmap is not None:
+                self._tiles.move_to_end(key)
+                painter.drawPixmap(rect, pixmap, QRectF(pixmap.rect()))
+            elif key not in self._pending:
+                self._pending.add(key)
+                hub.pool.start(_LoadTask(self.token, key, self.pyramid.tile_path(level, col, row)))
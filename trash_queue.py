@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+지연 삭제 큐
+삭제할 이미지 파일을 디스크의 대기열에 기록해 두고 백그라운드에서
+여러 파일씩 묶어 휴지통으로 이동합니다. 앱이 종료되어도 남은 대기열은
+다음 실행 시 이어서 처리됩니다.
+"""
+
+import os
+import json
+import threading
+from typing import List, Tuple, Iterable
+
+try:
+    from send2trash import send2trash
+except ImportError:
+    send2trash = None
+
+
+def delete_batch(paths: List[str], use_trash: bool = True) -> Tuple[List[str], List[str]]:
+    """파일 묶음을 휴지통으로 이동 (가능하면 한 번의 호출로). (성공 목록, 실패 목록) 반환"""
+    existing = [path for path in paths if os.path.exists(path)]
+    # 이미 없는 파일은 처리 완료로 간주
+    removed = [path for path in paths if path not in existing]
+    failed: List[str] = []
+    if not existing:
+        return removed, failed
+
+    if use_trash and send2trash is not None:
+        try:
+            # send2trash 1.8+는 경로 목록을 한 번에 받음
+            send2trash(existing)
+            return removed + existing, failed
+        except Exception as e:
+            print(f"[DEBUG] 일괄 휴지통 이동 실패, 개별 처리로 전환: {e}")
+
+    for path in existing:
+        try:
+            if use_trash and send2trash is not None:
+                send2trash(path)
+            else:
+                os.remove(path)
+            removed.append(path)
+        except FileNotFoundError:
+            removed.append(path)
+        except Exception as e:
+            print(f"[ERROR] 파일 삭제 실패 {path}: {e}")
+            failed.append(path)
+    return removed, failed
+
+
+class PendingDeletionQueue:
+    """디스크에 유지되는 삭제 대기열"""
+
+    def __init__(self, queue_file: str):
+        self.queue_file = queue_file
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        # 삭제 스레드의 확인~삭제 구간과 저장소의 기존 파일 재사용을 서로 배제
+        # (가져오기가 방금 휴지통으로 보낸 파일을 반환하지 않도록)
+        self.deletion_lock = threading.RLock()
+        # 이번 실행에서 처리한 수 (진행률 표시용)
+        self.completed = 0
+        self.load()
+
+    def load(self) -> None:
+        if not os.path.exists(self.queue_file):
+            return
+        try:
+            with open(self.queue_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            with self._lock:
+                self._pending = list(dict.fromkeys(data.get("pending", [])))
+            if self._pending:
+                print(f"[DEBUG] 이전 실행에서 남은 삭제 대기 파일 {len(self._pending)}개")
+        except Exception as e:
+            print(f"[ERROR] 삭제 대기열 로드 실패: {e}")
+
+    def _save_locked(self) -> None:
+        try:
+            if not self._pending:
+                if os.path.exists(self.queue_file):
+                    os.remove(self.queue_file)
+                return
+            tmp_path = self.queue_file + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"pending": self._pending}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.queue_file)
+        except Exception as e:
+            print(f"[ERROR] 삭제 대기열 저장 실패: {e}")
+
+    def add(self, paths: Iterable[str]) -> int:
+        """삭제 대기열에 추가하고 즉시 디스크에 기록. 추가된 수 반환"""
+        with self._lock:
+            known = set(self._pending)
+            added = [path for path in paths if path and path not in known]
+            if not added:
+                return 0
+            self._pending.extend(added)
+            self._save_locked()
+            return len(added)
+
+    def discard(self, paths: Iterable[str]) -> None:
+        """다시 사용하게 된 파일은 대기열에서 빼기"""
+        targets = set(paths)
+        with self._lock:
+            before = len(self._pending)
+            self._pending = [path for path in self._pending if path not in targets]
+            if len(self._pending) != before:
+                self._save_locked()
+
+    def peek_batch(self, size: int) -> List[str]:
+        with self._lock:
+            return list(self._pending[:size])
+
+    def mark_done(self, paths: Iterable[str]) -> None:
+        done = set(paths)
+        with self._lock:
+            self._pending = [path for path in self._pending if path not in done]
+            self.completed += len(done)
+            self._save_locked()
+
+    def defer(self, paths: Iterable[str]) -> None:
+        """실패한 파일은 대기열 뒤로 보내 다음 실행에서 재시도"""
+        failed = set(paths)
+        with self._lock:
+            self._pending = [path for path in self._pending if path not in failed] + \
+                [path for path in self._pending if path in failed]
+            self._save_locked()
+
+    def contains(self, path: str) -> bool:
+        with self._lock:
+            return path in self._pending
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)